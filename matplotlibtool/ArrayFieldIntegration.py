@@ -12,10 +12,18 @@ Overlay.y_scale, so neither operation rebuilds plot data.
 
 from __future__ import annotations
 
+import threading
+import weakref
 from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 import numpy as np
+from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import pyqtSignal
 
 from .ArrayFieldManager import ArrayFieldManager
 from .ArrayFieldPanel import ArrayFieldPanel
@@ -25,17 +33,67 @@ if TYPE_CHECKING:
     from .Plot2D import Plot2D
 
 
+# arrays at least this long compute a new field's points off the GUI thread
+ASYNC_MIN_ROWS = 1_000_000
+# multiplier edits arriving closer together than this render once
+MULTIPLIER_REDRAW_MS = 30
+
+
+class _PointsSignals(QObject):
+    """Carries points computed on a pool thread back to the GUI thread."""
+
+    # array_index, field_name, generation, (points, transform_params) or the
+    # exception the computation raised
+    pointsReady = pyqtSignal(int, str, int, object)
+
+
 class ArrayFieldIntegration:
     def __init__(self, viewer: Plot2D):
-        self.viewer = viewer
+        # the viewer owns this object; a proxy keeps the pair out of a
+        # reference cycle the cyclic collector would have to walk
+        self.viewer = weakref.proxy(viewer)
         self.array_field_manager = ArrayFieldManager(viewer.plot_manager)
         self.panel = ArrayFieldPanel(self)
         self.array_to_group: dict[int, int] = {}
         self.multipliers: dict[tuple[int, str], float] = {}
+        # per-array (N, 2) staging buffer: x filled once, y refilled per field.
+        # The transform engine always returns a fresh array, so plots never
+        # hold a reference to it
+        self._xy_buffers: dict[int, np.ndarray] = {}
+        # x after the array's transform; shared by every field plot of the
+        # array since the transform is fixed at registration
+        self._transformed_x: dict[int, np.ndarray] = {}
+
+        # a burst of field toggles renders once, on the next event-loop pass
+        self._redraw_timer = QTimer()
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self._flush_redraw)
+        # plots the pending redraw may update alone; None renders everything
+        self._redraw_plots: set[int] | None = None
+        self._batch_depth = 0
+        # field changes made inside a batch, reported in one line on exit
+        self._batch_log: list[str] = []
+
+        # fields whose points are being computed on a pool thread, mapped to
+        # the state last requested for them while the worker runs
+        self._pending: dict[tuple[int, str], bool] = {}
+        # bumped when an array's data changes, so stale results are dropped
+        self._generation: dict[int, int] = {}
+        # serializes cache fills per array between the GUI and pool threads
+        self._array_locks: dict[int, threading.RLock] = {}
+        self._points_signals = _PointsSignals()
+        self._points_signals.pointsReady.connect(self._on_points_ready)
 
     def create_panel_button(self, parent=None):
         return self.panel.create_button(parent)
 
+    def close(self) -> None:
+        """Stop the pending redraw; called when the viewer shuts down."""
+        self._redraw_timer.stop()
+        self._redraw_timer.timeout.disconnect(self._flush_redraw)
+        self._points_signals.pointsReady.disconnect(self._on_points_ready)
+        self._pending.clear()
+
     # ---------- registration ----------
 
     def register_array(
@@ -52,13 +110,24 @@ class ArrayFieldIntegration:
             properties["global_color_min"] = global_color_min
             properties["global_color_max"] = global_color_max
 
-        return self.array_field_manager.register_array(
+        array_index = self.array_field_manager.register_array(
             data=data,
             x_field=x_field,
             y_field=y_field,
             array_name=array_name,
             **properties,
         )
+        # styling every field plot of the array is created with, resolved once
+        self.array_field_manager.get_array_info(array_index)["plot_kwargs"] = {
+            "colormap": properties.get("colormap", self.viewer.default_colormap),
+            "point_size": properties.get("point_size", 2.0),
+            "draw_lines": properties.get("draw_lines", self.viewer.default_draw_lines),
+            "line_color": properties.get("line_color", None),
+            "line_width": properties.get("line_width", 1.0),
+            "offset_x": properties.get("x_offset", 0.0),
+            "offset_y": properties.get("y_offset", 0.0),
+        }
+        return array_index
 
     def register_field_plot(
         self,
@@ -98,6 +167,74 @@ class ArrayFieldIntegration:
     def get_multiplier(self, array_index: int, field_name: str) -> float:
         return self.multipliers.get((array_index, field_name), 1.0)
 
+    def _xy_points(self, array_index: int, field_name: str) -> np.ndarray:
+        """The array's staging buffer holding x and this field as y."""
+        manager = self.array_field_manager
+        buf = self._xy_buffers.get(array_index)
+        if buf is None:
+            info = manager.get_array_info(array_index)
+            buf = np.empty((len(info["data"]), 2), dtype=np.float32)
+            np.copyto(
+                buf[:, 0],
+                manager.get_field_column(array_index, info["x_field"]),
+                casting="unsafe",
+            )
+            self._xy_buffers[array_index] = buf
+        np.copyto(
+            buf[:, 1],
+            manager.get_field_column(array_index, field_name),
+            casting="unsafe",
+        )
+        return buf
+
+    def _transformed_points(
+        self,
+        array_index: int,
+        field_name: str,
+        params: TransformParams,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        (N, 2) plot points for a field under the array's transform.
+
+        Transforms act per axis, so x is transformed once per array and only
+        the y column is transformed for each field. When given, out is
+        filled and returned instead of allocating.
+        """
+        manager = self.array_field_manager
+        engine = self.viewer.transform_engine
+        x = self._transformed_x.get(array_index)
+        if x is None:
+            x_field = manager.get_array_info(array_index)["x_field"]
+            x = engine.transform_column(
+                manager.get_field_column(array_index, x_field), params, 0
+            )
+            self._transformed_x[array_index] = x
+
+        points = np.empty((len(x), 2), dtype=np.float32) if out is None else out
+        points[:, 0] = x
+        engine.transform_column(
+            manager.get_field_column(array_index, field_name),
+            params,
+            1,
+            out=points[:, 1],
+        )
+        return points
+
+    def _array_lock(self, array_index: int) -> threading.RLock:
+        lock = self._array_locks.get(array_index)
+        if lock is None:
+            lock = self._array_locks.setdefault(array_index, threading.RLock())
+        return lock
+
+    def invalidate_array_caches(self, array_index: int) -> None:
+        """Forget the columns cached from this array, after its data changed."""
+        with self._array_lock(array_index):
+            self.array_field_manager.clear_field_arrays(array_index)
+            self._xy_buffers.pop(array_index, None)
+            self._transformed_x.pop(array_index, None)
+            self._generation[array_index] = self._generation.get(array_index, 0) + 1
+
     # ---------- panel actions ----------
 
     def set_field_enabled(
@@ -110,20 +247,180 @@ class ArrayFieldIntegration:
             array_index, field_name
         )
 
+        plot_manager = self.viewer.plot_manager
+        if plot_index is not None and plot_manager.plots[plot_index].visible == enabled:
+            # a checkbox sync re-emitting the current state; nothing to do
+            return
+        render = True
         if plot_index is None:
+            key = (array_index, field_name)
+            if key in self._pending:
+                self._pending[key] = enabled
+                if not self._batch_depth:
+                    return
+                # a batch needs the plot now; the worker's result is dropped
+                del self._pending[key]
             if not enabled:
                 return
+            if not self._batch_depth and self._start_async_plot(
+                array_index, field_name
+            ):
+                return
             self._create_field_plot(array_index, field_name)
+        elif enabled or self._batch_depth or plot_manager.plots[plot_index].draw_lines:
+            # the redraw timer renders; the viewer's signal handler would not wait
+            plot_manager.set_plot_visibility(plot_index, enabled, notify=False)
+        else:
+            render = not self._hide_scatter_plot(plot_index)
+
+        if self._batch_depth:
+            self._batch_log.append(("+" if enabled else "-") + field_name)
+            return
+        if plot_index is None:
+            # only a new plot changes what the plot selector lists
+            self.viewer.control_bar_integration.refresh_plot_selector()
         else:
-            self.viewer.plot_manager.set_plot_visibility(plot_index, enabled)
             state = "enabled" if enabled else "disabled"
             print(f"[INFO] Field '{field_name}' {state} (plot {plot_index})")
+        if render:
+            self._schedule_redraw()
+        self.panel.update_button_label()
 
-        self.viewer._update_plot()
-        self.viewer.canvas.draw_idle()
+    def _start_async_plot(self, array_index: int, field_name: str) -> bool:
+        """
+        Compute a large field's points on a pool thread.
+
+        The plot is created by _on_points_ready once the points are back on
+        the GUI thread, so the event loop keeps running meanwhile. Returns
+        False for arrays small enough to plot directly.
+        """
+        info = self.array_field_manager.get_array_info(array_index)
+        if len(info["data"]) < ASYNC_MIN_ROWS:
+            return False
+
+        key = (array_index, field_name)
+        self._pending[key] = True
+        generation = self._generation.get(array_index, 0)
+        signals = self._points_signals
+        compute = self._field_points
+        self.viewer.busy_manager.start_busy(f"Adding field {field_name}")
+
+        def work() -> None:
+            try:
+                result = compute(array_index, field_name)
+            except Exception as e:  # MemoryError on the largest arrays included
+                result = e
+            signals.pointsReady.emit(array_index, field_name, generation, result)
+
+        QThreadPool.globalInstance().start(work)
+        return True
+
+    def _on_points_ready(
+        self,
+        array_index: int,
+        field_name: str,
+        generation: int,
+        result: tuple[np.ndarray, dict] | Exception,
+    ) -> None:
+        self.viewer.busy_manager.end_busy(f"Adding field {field_name}")
+        enabled = self._pending.pop((array_index, field_name), None)
+        if isinstance(result, Exception):
+            # the worker failed; the field stays off and can be enabled again
+            print(f"[ERROR] Field '{field_name}' could not be plotted: {result!r}")
+            # uncheck the field's box if the popup is showing it
+            self.panel.rebuild()
+            return
+        if not enabled:
+            return
+        if generation != self._generation.get(array_index, 0):
+            # the array was replaced while the worker ran; start over
+            self.set_field_enabled(array_index, field_name, True)
+            return
+        self._create_field_plot(array_index, field_name, result)
         self.viewer.control_bar_integration.refresh_plot_selector()
+        self._schedule_redraw()
         self.panel.update_button_label()
 
+    def _hide_scatter_plot(self, plot_index: int) -> bool:
+        """
+        Hide a field plot that draws no lines by hiding its artist.
+
+        Such a plot contributes nothing else to the axes, so no re-render is
+        needed; the shared auto marker size drops it at the next render.
+        Returns False when the plot has no artist yet and must be rendered.
+        """
+        plot_manager = self.viewer.plot_manager
+        artist = plot_manager.get_artist(plot_index)
+        if artist is None:
+            plot_manager.set_plot_visibility(plot_index, False, notify=False)
+            return False
+        if plot_manager.set_plot_visibility(plot_index, False, notify=False):
+            artist.set_visible(False)
+            self.viewer.event_handlers.refresh_pixel_dc()
+            self.viewer.canvas.draw_idle()
+        return True
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Apply several field changes with one render and one UI refresh.
+
+        PlotManager signals are held for the duration, so the viewer does not
+        re-render after every field; the DC overlays, plot selector, and
+        button label reconcile once on exit. Batches nest.
+        """
+        self._batch_depth += 1
+        signals = self.viewer.plot_manager.signals
+        was_blocked = signals.blockSignals(True)
+        try:
+            yield
+        finally:
+            signals.blockSignals(was_blocked)
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._batch_log:
+                    print(f"[INFO] Fields changed: {' '.join(self._batch_log)}")
+                    self._batch_log.clear()
+                self._redraw_timer.stop()
+                self._redraw_plots = None
+                self._flush_redraw()
+                self.viewer.control_bar_integration.refresh_plot_selector()
+                self.panel.update_button_label()
+
+    def _schedule_redraw(
+        self,
+        delay_ms: int = 0,
+        plot_index: int | None = None,
+    ) -> None:
+        """
+        Render on the timer; with plot_index, only that plot's artist is
+        redrawn unless something else asks for a full render meanwhile.
+        """
+        if not self._redraw_timer.isActive():
+            self._redraw_plots = None if plot_index is None else {plot_index}
+        elif self._redraw_plots is not None:
+            if plot_index is None:
+                self._redraw_plots = None
+            else:
+                self._redraw_plots.add(plot_index)
+        if delay_ms:
+            # restarting pushes the render out while edits keep arriving
+            self._redraw_timer.start(delay_ms)
+        elif not self._redraw_timer.isActive():
+            self._redraw_timer.start(0)
+
+    def _flush_redraw(self) -> None:
+        plots, self._redraw_plots = self._redraw_plots, None
+        if plots is None:
+            # visibility changed without notifying the viewer, so the DC
+            # overlays are reconciled here
+            self.viewer.event_handlers.refresh_pixel_dc()
+            self.viewer._update_plot()
+        else:
+            for plot_index in sorted(plots):
+                self.viewer._update_plot_artist(plot_index)
+        self.viewer.canvas.draw_idle()
+
     def set_visible_fields(
         self,
         array_index: int,
@@ -142,12 +439,24 @@ class ArrayFieldIntegration:
             raise KeyError(
                 f"array {array_index} has no fields {unknown}, has {available}"
             )
-        for field in available:
-            visible = self.is_field_visible(array_index, field)
-            if field in wanted and not visible:
-                self.set_field_enabled(array_index, field, True)
-            elif field not in wanted and visible:
-                self.set_field_enabled(array_index, field, False)
+        self.set_fields_enabled(
+            array_index,
+            [
+                (field, field in wanted)
+                for field in available
+                if (field in wanted) != self.is_field_visible(array_index, field)
+            ],
+        )
+
+    def set_fields_enabled(
+        self,
+        array_index: int,
+        items: Iterable[tuple[str, bool]],
+    ) -> None:
+        """Enable or disable several fields of an array as one batch."""
+        with self.batch_updates():
+            for field_name, enabled in items:
+                self.set_field_enabled(array_index, field_name, enabled)
 
     def replace_array_data(self, array_index: int, data: np.ndarray) -> None:
         """
@@ -160,41 +469,62 @@ class ArrayFieldIntegration:
         """
         manager = self.array_field_manager
         info = manager.get_array_info(array_index)
-        old_names = set(info["data"].dtype.names)
-        new_names = set(data.dtype.names or ())
+        old_names = info["field_set"]
+        new_names = frozenset(data.dtype.names or ())
         if new_names != old_names:
             raise ValueError(
                 f"array {array_index}: replacement fields {sorted(new_names)} "
                 f"do not match {sorted(old_names)}"
             )
 
-        info["data"] = data
-        x = data[info["x_field"]].astype(np.float32)
-        transform_params = info["properties"]["transform_params"]
+        old_rows = len(info["data"])
+        with self._array_lock(array_index):
+            manager.set_array_data(array_index, data)
+            self.invalidate_array_caches(array_index)
+        transform_params = TransformParams.from_dict(
+            info["properties"]["transform_params"]
+        )
         color_field = info["properties"].get("color_field")
         color_data = None
         color_range = None
         if color_field is not None:
-            color_data = data[color_field].astype(np.float32)
+            color_data = manager.get_field_array(array_index, color_field)
             if len(color_data):
                 color_range = (float(color_data.min()), float(color_data.max()))
                 info["properties"]["global_color_min"] = color_range[0]
                 info["properties"]["global_color_max"] = color_range[1]
 
+        rows = len(data)
+        plots = self.viewer.plot_manager.plots
         for field, plot_index in manager.array_fields[array_index].items():
             if plot_index is None:
                 continue
-            points_xy = np.column_stack((x, data[field].astype(np.float32)))
+            # a capture of the same length is written over the plot's previous
+            # points rather than into a freshly allocated buffer
+            previous = plots[plot_index].points
+            reuse = (
+                previous.shape == (rows, 2)
+                and previous.dtype == np.float32
+                and previous.flags.c_contiguous
+                and previous.flags.writeable
+            )
+            with self._array_lock(array_index):
+                points = self._transformed_points(
+                    array_index,
+                    field,
+                    transform_params,
+                    out=previous if reuse else None,
+                )
             self.viewer.plot_manager.replace_plot_points(
                 plot_index,
-                self.viewer.transform_engine.apply_transform(
-                    points_xy, transform_params
-                ),
+                points,
                 color_data,
                 color_range,
             )
 
-        self.viewer.control_bar_integration.refresh_plot_selector()
+        if rows != old_rows:
+            # selector labels carry point counts; nothing else there changed
+            self.viewer.control_bar_integration.refresh_plot_selector()
         if not self.viewer.event_handlers.recompute_pixel_dc():
             self.viewer._update_plot()
             self.viewer.canvas.draw_idle()
@@ -212,77 +542,104 @@ class ArrayFieldIntegration:
         plot_index = self.array_field_manager.get_field_plot_index(
             array_index, field_name
         )
-        print(f"[INFO] Multiplier for '{field_name}': {value:g}")
         if plot_index is None:
             return
 
-        self.viewer.plot_manager.plots[plot_index].y_scale = value
-        self.viewer._update_plot()
-        self.viewer.canvas.draw_idle()
+        plot = self.viewer.plot_manager.plots[plot_index]
+        plot.y_scale = value
+        if not plot.visible:
+            # applied at render time, so a hidden plot picks it up when shown
+            return
+        # a scale moves points only vertically: a plot drawn as a bare
+        # scatter can update its own artist and leave the rest as drawn
+        alone = not plot.draw_lines and plot.scatter_artist is not None
+        self._schedule_redraw(MULTIPLIER_REDRAW_MS, plot_index if alone else None)
 
     # ---------- plot creation ----------
 
-    def _create_field_plot(self, array_index: int, field_name: str) -> None:
-        info = self.array_field_manager.get_array_info(array_index)
-        data = info["data"]
-        x_field = info["x_field"]
-        properties = info["properties"]
+    def _field_points(
+        self,
+        array_index: int,
+        field_name: str,
+    ) -> tuple[np.ndarray, dict]:
+        """
+        Transformed (N, 2) points for a field and the transform used.
 
-        points_xy = np.column_stack(
-            (
-                data[x_field].astype(np.float32),
-                data[field_name].astype(np.float32),
-            )
-        )
+        Runs on the GUI thread or a pool thread; the array's lock keeps the
+        two from filling the same caches at once.
+        """
+        with self._array_lock(array_index):
+            return self._compute_field_points(array_index, field_name)
 
+    def _compute_field_points(
+        self,
+        array_index: int,
+        field_name: str,
+    ) -> tuple[np.ndarray, dict]:
+        properties = self.array_field_manager.get_array_info(array_index)[
+            "properties"
+        ]
         transform_params = properties.get("transform_params")
         if transform_params:
-            transformed_points = self.viewer.transform_engine.apply_transform(
-                points_xy, TransformParams.from_dict(transform_params)
+            transformed_points = self._transformed_points(
+                array_index, field_name, TransformParams.from_dict(transform_params)
             )
         elif properties.get("normalize", False):
             transformed_points, params = self.viewer.transform_engine.normalize_points(
-                points_xy
+                self._xy_points(array_index, field_name)
             )
             transform_params = params.to_dict()
         elif properties.get("center", False):
             transformed_points, params = self.viewer.transform_engine.center_points(
-                points_xy
+                self._xy_points(array_index, field_name)
             )
             transform_params = params.to_dict()
         else:
             transformed_points, params = self.viewer.transform_engine.raw_points(
-                points_xy
+                self._xy_points(array_index, field_name)
             )
             transform_params = params.to_dict()
+        return transformed_points, transform_params
+
+    def _create_field_plot(
+        self,
+        array_index: int,
+        field_name: str,
+        points: tuple[np.ndarray, dict] | None = None,
+    ) -> None:
+        info = self.array_field_manager.get_array_info(array_index)
+        properties = info["properties"]
+        transformed_points, transform_params = (
+            points
+            if points is not None
+            else self._field_points(array_index, field_name)
+        )
 
         color_field = properties.get("color_field")
         color_data = (
-            data[color_field].astype(np.float32)
-            if color_field is not None and color_field in data.dtype.names
+            self.array_field_manager.get_field_array(array_index, color_field)
+            if color_field is not None and color_field in info["field_set"]
             else None
         )
 
         with self.viewer.busy_manager.busy_operation(f"Adding field {field_name}"):
-            plot_index = self.viewer.plot_manager.add_plot(
-                points=transformed_points,
-                color_data=color_data,
-                colormap=properties.get("colormap", self.viewer.default_colormap),
-                point_size=properties.get("point_size", 2.0),
-                draw_lines=properties.get(
-                    "draw_lines", self.viewer.default_draw_lines
-                ),
-                line_color=properties.get("line_color", None),
-                line_width=properties.get("line_width", 1.0),
-                offset_x=properties.get("x_offset", 0.0),
-                offset_y=properties.get("y_offset", 0.0),
-                visible=True,
-                transform_params=transform_params,
-                plot_name=field_name,
-                is_array_parent=False,
-                global_color_min=properties.get("global_color_min"),
-                global_color_max=properties.get("global_color_max"),
-            )
+            # plotAdded would render at once; the redraw timer renders instead
+            signals = self.viewer.plot_manager.signals
+            was_blocked = signals.blockSignals(True)
+            try:
+                plot_index = self.viewer.plot_manager.add_plot(
+                    points=transformed_points,
+                    color_data=color_data,
+                    visible=True,
+                    transform_params=transform_params,
+                    plot_name=field_name,
+                    is_array_parent=False,
+                    global_color_min=properties.get("global_color_min"),
+                    global_color_max=properties.get("global_color_max"),
+                    **info["plot_kwargs"],
+                )
+            finally:
+                signals.blockSignals(was_blocked)
 
             # a field enabled later must look like the ones already drawn, so
             # marker sizing follows a sibling field of the same array rather
@@ -315,7 +672,12 @@ class ArrayFieldIntegration:
                     group_info.plot_indices.append(plot_index)
                     self.viewer.plot_manager.plot_to_group[plot_index] = group_id
 
-            print(f"[INFO] Added field plot: {field_name} (plot index {plot_index})")
+            if not self._batch_depth:
+                print(
+                    f"[INFO] Added field plot: {field_name} (plot index {plot_index})"
+                )
 
-        # creation emits no visibility signal, so the DC overlays reconcile here
-        self.viewer.event_handlers.refresh_pixel_dc()
+        # creation emits no visibility signal, so the DC overlays reconcile
+        # here; a batch reconciles once on exit instead
+        if not self._batch_depth:
+            self.viewer.event_handlers.refresh_pixel_dc()
@@ -19,6 +19,43 @@ if TYPE_CHECKING:
     from .PlotManager import PlotManager
 
 
+def homogeneous_columns(data: np.ndarray) -> tuple[np.ndarray, dict[str, int]] | None:
+    """
+    2D view of a structured array whose fields all share one scalar dtype.
+
+    Packed records of identical fields reinterpret as an (N, F) plain array,
+    so a field becomes an integer column of an ordinary ndarray rather than
+    a structured-field gather. Returns (view, field_name -> column) or None
+    when the layout is heterogeneous, padded, or not contiguous.
+    """
+    fields = data.dtype.fields
+    if fields is None or data.ndim != 1 or not data.flags.c_contiguous:
+        return None
+
+    base = None
+    column_index: dict[str, int] = {}
+    for name, spec in fields.items():
+        field_dtype, offset = spec[0], spec[1]
+        if field_dtype.shape or field_dtype.fields is not None or field_dtype.hasobject:
+            return None
+        if base is None:
+            base = field_dtype
+        elif field_dtype != base:
+            return None
+        column, remainder = divmod(offset, base.itemsize)
+        if remainder:
+            return None
+        column_index[name] = column
+
+    if base is None or data.dtype.itemsize != len(column_index) * base.itemsize:
+        return None
+    if len(set(column_index.values())) != len(column_index):
+        return None
+
+    view = data.view(base).reshape(len(data), len(column_index))
+    return view, column_index
+
+
 class ArrayFieldManager:
     """
     Manages arrays and their associated field plots.
@@ -37,7 +74,12 @@ class ArrayFieldManager:
         """
         self.plot_manager = plot_manager
 
-        # Array tracking: array_index -> {'data': structured_array, 'x_field': str, 'name': str, 'properties': dict}
+        # Array tracking: array_index -> {'data': structured_array, 'x_field': str, 'name': str, 'properties': dict,
+        #                                 'field_names': dtype.names tuple, in dtype order,
+        #                                 'field_set': frozenset of dtype.names,
+        #                                 'field_views': {field: 1D view into data}, built once,
+        #                                 'float32': {field: contiguous float32 column}, filled on demand,
+        #                                 'plot_kwargs': dict (set by ArrayFieldIntegration)}
         self.arrays: dict[int, dict] = {}
 
         # Field tracking: array_index -> {field_name: plot_index or None}
@@ -78,7 +120,10 @@ class ArrayFieldManager:
             "x_field": x_field,
             "name": array_name or f"Array {array_index + 1}",
             "properties": properties,
+            "field_names": data.dtype.names,
+            "field_set": frozenset(data.dtype.names),
         }
+        self._index_columns(array_index)
 
         # Initialize field tracking for all fields in the array
         field_names = [f for f in data.dtype.names if f != x_field]
@@ -86,6 +131,114 @@ class ArrayFieldManager:
 
         return array_index
 
+    def set_array_data(self, array_index: int, data: np.ndarray) -> None:
+        """
+        Replace the structured array behind an array.
+
+        Args:
+            array_index: Index of the array
+            data: New structured array with the same fields
+        """
+        self.arrays[array_index]["data"] = data
+        self._index_columns(array_index)
+
+    def _index_columns(self, array_index: int) -> None:
+        info = self.arrays[array_index]
+        info["float32"] = {}
+        data = info["data"]
+        # one view per field, made here rather than per access: structured
+        # field indexing validates the field on every call
+        columns = homogeneous_columns(data)
+        if columns is None:
+            info["field_views"] = {name: data[name] for name in data.dtype.names}
+        else:
+            view, column_index = columns
+            info["field_views"] = {
+                name: view[:, column] for name, column in column_index.items()
+            }
+
+    def has_field(self, array_index: int, field_name: str) -> bool:
+        """
+        Check whether an array's structured dtype has a field.
+
+        Args:
+            array_index: Index of the array
+            field_name: Name of the field
+
+        Returns:
+            True if the field exists (including the X field)
+        """
+        info = self.arrays.get(array_index)
+        return info is not None and field_name in info["field_set"]
+
+    def get_field_column(self, array_index: int, field_name: str) -> np.ndarray:
+        """
+        Get one field of an array as a 1D view, without copying.
+
+        Args:
+            array_index: Index of the array
+            field_name: Name of the field
+
+        Returns:
+            Column of the homogeneous 2D view when there is one, else the
+            structured field
+        """
+        return self.arrays[array_index]["field_views"][field_name]
+
+    def get_field_array(self, array_index: int, field_name: str) -> np.ndarray:
+        """
+        Get one field of an array as a contiguous float32 array, cached.
+
+        The first request for a field pays the cast; later ones, from any
+        field plot of the array, share the same array.
+
+        Args:
+            array_index: Index of the array
+            field_name: Name of the field
+
+        Returns:
+            Contiguous float32 column (the source itself when it already is one)
+        """
+        cache = self.arrays[array_index]["float32"]
+        column = cache.get(field_name)
+        if column is None:
+            column = np.ascontiguousarray(
+                self.get_field_column(array_index, field_name),
+                dtype=np.float32,
+            )
+            cache[field_name] = column
+        return column
+
+    def cache_field_array(
+        self,
+        array_index: int,
+        field_name: str,
+        column: np.ndarray,
+    ) -> None:
+        """
+        Seed the float32 cache with a column already cast from this array.
+
+        Lets the plot that registered the array share its color data with
+        the field plots created later. A column that is not contiguous
+        float32 is ignored.
+
+        Args:
+            array_index: Index of the array
+            field_name: Name of the field the column was taken from
+            column: The cast column
+        """
+        if column.dtype == np.float32 and column.flags.c_contiguous:
+            self.arrays[array_index]["float32"][field_name] = column
+
+    def clear_field_arrays(self, array_index: int) -> None:
+        """
+        Drop the cached float32 columns, after the array was written in place.
+
+        Args:
+            array_index: Index of the array
+        """
+        self.arrays[array_index]["float32"] = {}
+
     def register_field_plot(
         self,
         array_index: int,
@@ -100,8 +253,9 @@ class ArrayFieldManager:
             field_name: Name of the field
             plot_index: Index of the created plot
         """
-        if array_index in self.array_fields:
-            self.array_fields[array_index][field_name] = plot_index
+        fields = self.array_fields.get(array_index)
+        if fields is not None:
+            fields[field_name] = plot_index
             self.plot_to_array_field[plot_index] = (array_index, field_name)
 
     def get_array_fields(self, array_index: int) -> list[str]:
@@ -114,9 +268,8 @@ class ArrayFieldManager:
         Returns:
             List of field names
         """
-        if array_index in self.array_fields:
-            return list(self.array_fields[array_index].keys())
-        return []
+        fields = self.array_fields.get(array_index)
+        return list(fields) if fields is not None else []
 
     def get_active_fields(self, array_index: int) -> list[str]:
         """
@@ -128,13 +281,10 @@ class ArrayFieldManager:
         Returns:
             List of field names that are currently plotted
         """
-        if array_index in self.array_fields:
-            return [
-                field
-                for field, plot_idx in self.array_fields[array_index].items()
-                if plot_idx is not None
-            ]
-        return []
+        fields = self.array_fields.get(array_index)
+        if fields is None:
+            return []
+        return [field for field, plot_idx in fields.items() if plot_idx is not None]
 
     def is_field_active(
         self,
@@ -151,9 +301,8 @@ class ArrayFieldManager:
         Returns:
             True if field is plotted
         """
-        if array_index in self.array_fields:
-            return self.array_fields[array_index].get(field_name) is not None
-        return False
+        fields = self.array_fields.get(array_index)
+        return fields is not None and fields.get(field_name) is not None
 
     def get_field_plot_index(
         self,
@@ -170,9 +319,8 @@ class ArrayFieldManager:
         Returns:
             Plot index or None if not plotted
         """
-        if array_index in self.array_fields:
-            return self.array_fields[array_index].get(field_name)
-        return None
+        fields = self.array_fields.get(array_index)
+        return fields.get(field_name) if fields is not None else None
 
     def get_array_info(self, array_index: int) -> dict | None:
         """
@@ -196,9 +344,8 @@ class ArrayFieldManager:
         Returns:
             Array name or None
         """
-        if array_index in self.arrays:
-            return self.arrays[array_index]["name"]
-        return None
+        info = self.arrays.get(array_index)
+        return info["name"] if info is not None else None
 
     def get_array_count(self) -> int:
         """Get total number of registered arrays."""
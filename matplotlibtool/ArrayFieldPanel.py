@@ -12,8 +12,10 @@ and scale rows.
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
+from PyQt6.QtCore import QSignalBlocker
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QCheckBox
 from PyQt6.QtWidgets import QHBoxLayout
@@ -50,6 +52,11 @@ class ArrayFieldPanel:
         self._content: QWidget | None = None
         self._content_layout: QVBoxLayout | None = None
         self._scroll: QScrollArea | None = None
+        # array_index -> {field_name: checkbox}, for syncing after bulk changes
+        self._checkboxes: dict[int, dict[str, QCheckBox]] = {}
+        self._editors: dict[int, dict[str, QLineEdit]] = {}
+        # arrays and fields the current widgets were built for
+        self._layout_key: tuple | None = None
 
     def create_button(self, parent=None) -> QToolButton:
         button = QToolButton(parent)
@@ -80,37 +87,79 @@ class ArrayFieldPanel:
         return button
 
     def update_button_label(self) -> None:
-        manager = self.integration.array_field_manager
+        # runs after every toggle: walk the plot indices directly rather than
+        # resolving each field by name
+        plots = self.integration.viewer.plot_manager.plots
         total = 0
         enabled = 0
-        for array_index in manager.arrays:
-            for field_name in manager.get_array_fields(array_index):
-                total += 1
-                if self.integration.is_field_visible(array_index, field_name):
-                    enabled += 1
+        for fields in self.integration.array_field_manager.array_fields.values():
+            total += len(fields)
+            enabled += sum(
+                1 for i in fields.values() if i is not None and plots[i].visible
+            )
         self.button.setText(f"Fields {enabled}/{total} ▾" if total else "Fields ▾")
 
     def rebuild(self) -> None:
+        # runs on every popup open: while the arrays and fields are the same,
+        # keep the widgets and only refresh their values
+        key = self._current_layout_key()
+        if key == self._layout_key:
+            self._sync_values()
+            return
+
+        # one layout and paint pass for the whole list, not one per row
+        self._content.setUpdatesEnabled(False)
+        try:
+            self._populate()
+        finally:
+            self._content.setUpdatesEnabled(True)
+        self._layout_key = key
+        self._size_popup_to_content()
+
+    def _current_layout_key(self) -> tuple:
+        manager = self.integration.array_field_manager
+        key = []
+        for array_index in sorted(manager.arrays):
+            info = manager.get_array_info(array_index)
+            key.append(
+                (
+                    array_index,
+                    info["name"],
+                    info["x_field"],
+                    tuple(manager.get_array_fields(array_index)),
+                )
+            )
+        return tuple(key)
+
+    def _sync_values(self) -> None:
+        for array_index, checkboxes in self._checkboxes.items():
+            for field_name, checkbox in checkboxes.items():
+                with QSignalBlocker(checkbox):
+                    checkbox.setChecked(
+                        self.integration.is_field_visible(array_index, field_name)
+                    )
+        for array_index, editors in self._editors.items():
+            for field_name, editor in editors.items():
+                multiplier = self.integration.get_multiplier(array_index, field_name)
+                editor.setText(f"{multiplier:g}")
+
+    def _populate(self) -> None:
         _clear_layout(self._content_layout)
+        self._checkboxes = {}
+        self._editors = {}
         manager = self.integration.array_field_manager
 
         if not manager.arrays:
             self._content_layout.addWidget(QLabel("no arrays loaded"))
         else:
             for array_index in sorted(manager.arrays):
-                info = manager.get_array_info(array_index)
-                header = QLabel(
-                    f"<b>{info['name']}</b>&nbsp;&nbsp;<i>x: {info['x_field']}</i>"
-                )
-                self._content_layout.addWidget(header)
+                self._content_layout.addLayout(self._build_array_header(array_index))
 
                 for field_name in manager.get_array_fields(array_index):
                     self._content_layout.addLayout(
                         self._build_field_row(array_index, field_name)
                     )
 
-        self._size_popup_to_content()
-
     def _size_popup_to_content(self) -> None:
         # QScrollArea's own sizeHint ignores its content, which leaves the
         # menu at a stub height; force min sizes from the content instead
@@ -125,6 +174,22 @@ class ArrayFieldPanel:
         self._scroll.setMaximumHeight(self.max_popup_height)
         self._scroll.setMinimumWidth(hint.width() + scrollbar_width + frame)
 
+    def _build_array_header(self, array_index: int) -> QHBoxLayout:
+        info = self.integration.array_field_manager.get_array_info(array_index)
+        row = QHBoxLayout()
+        row.setSpacing(4)
+        row.addWidget(
+            QLabel(f"<b>{info['name']}</b>&nbsp;&nbsp;<i>x: {info['x_field']}</i>"),
+            1,
+        )
+        for text, enabled in (("All", True), ("None", False)):
+            button = QToolButton()
+            button.setText(text)
+            button.setAutoRaise(True)
+            button.clicked.connect(partial(self._on_set_all, array_index, enabled))
+            row.addWidget(button)
+        return row
+
     def _build_field_row(self, array_index: int, field_name: str) -> QHBoxLayout:
         row = QHBoxLayout()
         row.setContentsMargins(16, 0, 0, 0)
@@ -132,21 +197,17 @@ class ArrayFieldPanel:
 
         checkbox = QCheckBox(field_name)
         checkbox.setChecked(self.integration.is_field_visible(array_index, field_name))
-        checkbox.toggled.connect(
-            lambda checked, ai=array_index, fn=field_name: self._on_toggled(
-                ai, fn, checked
-            )
-        )
+        self._checkboxes.setdefault(array_index, {})[field_name] = checkbox
+        checkbox.toggled.connect(partial(self._on_toggled, array_index, field_name))
         row.addWidget(checkbox, 1)
 
         multiplier = self.integration.get_multiplier(array_index, field_name)
         editor = QLineEdit(f"{multiplier:g}")
         editor.setMaximumWidth(80)
         editor.setToolTip("Y multiplier (scientific notation accepted)")
+        self._editors.setdefault(array_index, {})[field_name] = editor
         editor.editingFinished.connect(
-            lambda ed=editor, ai=array_index, fn=field_name: self._on_multiplier_edited(
-                ed, ai, fn
-            )
+            partial(self._on_multiplier_edited, editor, array_index, field_name)
         )
         row.addWidget(editor)
         return row
@@ -154,6 +215,23 @@ class ArrayFieldPanel:
     def _on_toggled(self, array_index: int, field_name: str, checked: bool) -> None:
         self.integration.set_field_enabled(array_index, field_name, checked)
 
+    def _on_set_all(
+        self,
+        array_index: int,
+        enabled: bool,
+        _checked: bool = False,
+    ) -> None:
+        # one batch: a single render and selector refresh for the whole array
+        fields = self.integration.array_field_manager.get_array_fields(array_index)
+        self.integration.set_fields_enabled(
+            array_index, [(field_name, enabled) for field_name in fields]
+        )
+        for field_name, checkbox in self._checkboxes.get(array_index, {}).items():
+            with QSignalBlocker(checkbox):
+                checkbox.setChecked(
+                    self.integration.is_field_visible(array_index, field_name)
+                )
+
     def _on_multiplier_edited(
         self,
         editor: QLineEdit,
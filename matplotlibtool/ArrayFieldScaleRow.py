@@ -10,10 +10,12 @@ for each field from the currently selected structured array.
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import QObject
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QSignalBlocker
+from PyQt6.QtCore import QTimer
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QPalette
 from PyQt6.QtWidgets import QDoubleSpinBox
@@ -25,6 +27,29 @@ from PyQt6.QtWidgets import QWidget
 if TYPE_CHECKING:
     from .ArrayFieldManager import ArrayFieldManager
 
+# set once on the input container; rows switch it on through a property
+_PENDING_QSS = 'QDoubleSpinBox[pending="true"] { background-color: #FFFF99; }'
+
+
+def _set_pending(spin: QDoubleSpinBox, pending: bool) -> None:
+    """Highlight a spinbox whose value is not yet applied, or clear it."""
+    if bool(spin.property("pending")) == pending:
+        return
+    spin.setProperty("pending", pending)
+    # re-evaluate the container's selector for this widget only
+    spin.style().unpolish(spin)
+    spin.style().polish(spin)
+
+
+def _set_applied(spin: QDoubleSpinBox, scale: float) -> None:
+    """Show an applied scale silently and make it the highlight baseline."""
+    # kept on the spinbox, like "pending", so the per-keystroke check needs
+    # no field lookup
+    spin.setProperty("appliedScale", scale)
+    with QSignalBlocker(spin):
+        spin.setValue(scale)
+        _set_pending(spin, False)
+
 
 class ArrayFieldScaleSignals(QObject):
     """Signal hub for array field scale events."""
@@ -57,6 +82,21 @@ class ArrayFieldScaleRow:
         # Track scale input widgets by field name
         self.scale_inputs: dict[str, QDoubleSpinBox] = {}
 
+        # Every row built so far, in layout order: (container, label, spinbox).
+        # Rows are reused across arrays instead of deleted and rebuilt
+        self._rows: list[tuple[QWidget, QLabel, QDoubleSpinBox]] = []
+
+        # Field shown in each visible row, by row position
+        self._row_fields: list[str] = []
+
+        # Pending-edit highlights are restyled at most once per interval,
+        # not on every digit typed or arrow click
+        self._pending_rows: set[int] = set()
+        self._highlight_timer = QTimer()
+        self._highlight_timer.setSingleShot(True)
+        self._highlight_timer.setInterval(50)
+        self._highlight_timer.timeout.connect(self._apply_pending_highlights)
+
         # Track current scale factors: field_name -> scale_factor
         self.current_scales: dict[str, float] = {}
 
@@ -108,6 +148,7 @@ class ArrayFieldScaleRow:
         )
         self.input_layout.setSpacing(6)
         self.input_layout.addStretch()
+        self.input_container.setStyleSheet(_PENDING_QSS)
 
         self.scroll_area.setWidget(self.input_container)
         container_layout.addWidget(self.scroll_area, 1)
@@ -131,8 +172,18 @@ class ArrayFieldScaleRow:
     def _rebuild_scale_inputs(self) -> None:
         """
         Rebuild all scale inputs based on current array's fields.
+
+        Painting is suspended for the rebuild, so the row re-lays out and
+        repaints once rather than once per inserted field.
         """
-        # Clear existing inputs
+        self.input_container.setUpdatesEnabled(False)
+        try:
+            self._populate_scale_inputs()
+        finally:
+            self.input_container.setUpdatesEnabled(True)
+
+    def _populate_scale_inputs(self) -> None:
+        # Hide existing inputs; they are reused below
         self._clear_scale_inputs()
 
         if self.current_array_index is None:
@@ -154,114 +205,129 @@ class ArrayFieldScaleRow:
         if not fields:
             return
 
-        # Create scale input for each field
-        for field_name in fields:
-            current_scale = self.current_scales.get(field_name, 1.0)
-
-            # Create container for label + spinbox
-            field_container = QWidget()
-            field_layout = QHBoxLayout(field_container)
-            field_layout.setContentsMargins(
-                0,
-                0,
-                0,
-                0,
-            )
-            field_layout.setSpacing(2)
-
-            # Create label
-            label = QLabel(f"{field_name}:")
-            field_layout.addWidget(label)
-
-            # Create spin box
-            spin = QDoubleSpinBox()
-            spin.setRange(-1e6, 1e6)
-            spin.setDecimals(3)
-            spin.setSingleStep(0.1)
-            spin.setValue(current_scale)
-            spin.setFixedWidth(60)
-
-            # Disable keyboard tracking - only apply on Enter
-            spin.setKeyboardTracking(False)
-
-            # Connect to handler with field_name captured
-            spin.editingFinished.connect(
-                lambda fname=field_name, s=spin: self._on_scale_changed(fname, s)
-            )
-
-            # Connect to value changed to highlight pending changes
-            spin.valueChanged.connect(
-                lambda value, fname=field_name, s=spin: self._on_scale_value_changed(
-                    fname, s
-                )
-            )
-
-            field_layout.addWidget(spin)
-
-            # Store reference
+        # Only grow the pool; rows left over from a wider array stay hidden
+        while len(self._rows) < len(fields):
+            self._rows.append(self._create_row(len(self._rows)))
+
+        # Retitle and reset one pooled row per field
+        for row, field_name in enumerate(fields):
+            field_container, label, spin = self._rows[row]
+            label.setText(f"{field_name}:")
+            _set_applied(spin, self.current_scales.get(field_name, 1.0))
+            field_container.show()
             self.scale_inputs[field_name] = spin
 
-            # Add container to main layout (before the stretch)
-            self.input_layout.insertWidget(
-                self.input_layout.count() - 1, field_container
-            )
+        self._row_fields = list(fields)
+
+    def _create_row(self, row: int) -> tuple[QWidget, QLabel, QDoubleSpinBox]:
+        """
+        Create the label + spinbox pair for one row position.
+
+        Args:
+            row: Position of the row; its handlers resolve the field shown
+                there at signal time, so the row can be reused across arrays
+
+        Returns:
+            Tuple of (container, label, spinbox)
+        """
+        # Create container for label + spinbox
+        field_container = QWidget()
+        field_layout = QHBoxLayout(field_container)
+        field_layout.setContentsMargins(
+            0,
+            0,
+            0,
+            0,
+        )
+        field_layout.setSpacing(2)
+
+        # Create label
+        label = QLabel()
+        field_layout.addWidget(label)
+
+        # Create spin box
+        spin = QDoubleSpinBox()
+        spin.setRange(-1e6, 1e6)
+        spin.setDecimals(3)
+        spin.setSingleStep(0.1)
+        spin.setFixedWidth(60)
+        spin.setProperty("appliedScale", 1.0)
+
+        # Disable keyboard tracking - only apply on Enter
+        spin.setKeyboardTracking(False)
+
+        # Bind the row position up front; partial holds no closure cells
+        spin.editingFinished.connect(partial(self._on_scale_changed, row))
+
+        # Connect to value changed to highlight pending changes
+        spin.valueChanged.connect(partial(self._on_scale_value_changed, row))
+
+        field_layout.addWidget(spin)
+
+        # Add container to main layout (before the stretch)
+        self.input_layout.insertWidget(row, field_container)
+        return field_container, label, spin
 
     def _clear_scale_inputs(self) -> None:
-        """Remove all existing scale input widgets from the layout."""
-        # Remove and delete all input widgets
-        while self.input_layout.count() > 1:  # Keep the stretch at the end
-            item = self.input_layout.takeAt(0)
-            if item is not None:
-                widget = item.widget()
-                if widget is not None:
-                    widget.setParent(None)
-                    widget.deleteLater()
+        """Hide all scale input rows, keeping them for the next rebuild."""
+        for field_container, _, _ in self._rows:
+            field_container.hide()
 
         self.scale_inputs.clear()
+        self._row_fields = []
 
     def _on_scale_value_changed(
         self,
-        field_name: str,
-        spin: QDoubleSpinBox,
+        row: int,
+        value: float,
     ) -> None:
         """
-        Handle scale value changed (while typing) - highlight as pending.
+        Handle scale value changed (while typing) - queue the highlight.
 
         Args:
-            field_name: Name of the field
-            spin: The spinbox widget
+            row: Position of the row whose spinbox changed
+            value: New spinbox value
         """
-        current_stored = self.current_scales.get(field_name, 1.0)
+        self._pending_rows.add(row)
+        if not self._highlight_timer.isActive():
+            self._highlight_timer.start()
+
+    def _apply_pending_highlights(self) -> None:
+        """Highlight rows whose spinbox differs from the applied scale."""
+        rows, self._pending_rows = self._pending_rows, set()
+        for row in rows:
+            if row >= len(self._row_fields):
+                continue  # a hidden pooled row
 
-        if abs(spin.value() - current_stored) > 1e-6:
-            # Value changed but not applied - highlight with yellow background
-            spin.setStyleSheet("QDoubleSpinBox { background-color: #FFFF99; }")
-        else:
-            # Value matches stored - clear highlight
-            spin.setStyleSheet("")
+            spin = self._rows[row][2]
+
+            # Highlight a value changed but not applied; clear it otherwise
+            applied = spin.property("appliedScale")
+            _set_pending(spin, abs(spin.value() - applied) > 1e-6)
 
     def _on_scale_changed(
         self,
-        field_name: str,
-        spin: QDoubleSpinBox,
+        row: int,
     ) -> None:
         """
         Handle scale factor change (Enter pressed).
 
         Args:
-            field_name: Name of the field
-            spin: The spinbox widget
+            row: Position of the row whose spinbox was edited
         """
-        if self.current_array_index is None:
+        if self.current_array_index is None or row >= len(self._row_fields):
             return
 
+        field_name = self._row_fields[row]
+        spin = self._rows[row][2]
         new_scale = spin.value()
 
         # Store the new scale factor
         self.current_scales[field_name] = new_scale
 
         # Clear highlight - change is now applied
-        spin.setStyleSheet("")
+        spin.setProperty("appliedScale", new_scale)
+        _set_pending(spin, False)
 
         # Emit signal for viewer to handle scaling
         self.signals.scaleChanged.emit(
@@ -270,8 +336,6 @@ class ArrayFieldScaleRow:
             new_scale,
         )
 
-        print(f"[INFO] Scale factor for '{field_name}' changed to {new_scale:.3f}")
-
     def get_scale_factor(self, field_name: str) -> float:
         """
         Get the current scale factor for a field.
@@ -299,22 +363,20 @@ class ArrayFieldScaleRow:
         self.current_scales[field_name] = scale
 
         if field_name in self.scale_inputs:
-            spin = self.scale_inputs[field_name]
-            spin.blockSignals(True)
-            spin.setValue(scale)
-            spin.setStyleSheet("")  # Clear any highlight
-            spin.blockSignals(False)
+            _set_applied(self.scale_inputs[field_name], scale)
 
     def sync_all_scale_inputs(self) -> None:
         """
         Synchronize all scale input values with stored scale factors.
+
+        Painting is suspended for the loop so the row repaints once.
         """
         if self.current_array_index is None:
             return
 
-        for field_name, spin in self.scale_inputs.items():
-            stored_scale = self.current_scales.get(field_name, 1.0)
-            spin.blockSignals(True)
-            spin.setValue(stored_scale)
-            spin.setStyleSheet("")  # Clear any highlight
-            spin.blockSignals(False)
+        self.input_container.setUpdatesEnabled(False)
+        try:
+            for field_name, spin in self.scale_inputs.items():
+                _set_applied(spin, self.current_scales.get(field_name, 1.0))
+        finally:
+            self.input_container.setUpdatesEnabled(True)
@@ -10,9 +10,11 @@ currently selected structured array are plotted.
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QSignalBlocker
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QCheckBox
 from PyQt6.QtWidgets import QHBoxLayout
@@ -55,6 +57,10 @@ class ArrayFieldVisibilityRow:
         # Track checkbox widgets by field name
         self.checkboxes: dict[str, QCheckBox] = {}
 
+        # Checkboxes hidden by an earlier rebuild, reused before creating new
+        # ones so array switches do not delete and reallocate widgets
+        self._freelist: list[QCheckBox] = []
+
         # Currently displayed array
         self.current_array_index: int | None = None
 
@@ -113,16 +119,37 @@ class ArrayFieldVisibilityRow:
         """
         Set the currently displayed array and rebuild checkboxes.
 
+        When the new array has the same fields, in the same order, as the
+        one shown, the checkboxes are kept and only their states synced.
+
         Args:
             array_index: Index of the array to display
         """
         self.current_array_index = array_index
+
+        array_info = self.array_field_manager.get_array_info(array_index)
+        fields = self.array_field_manager.get_array_fields(array_index)
+        if array_info and fields and list(self.checkboxes) == fields:
+            self.info_label.setText(f"Show Fields ({array_info['name']}):")
+            self.sync_all_checkboxes()
+            return
+
         self._rebuild_checkboxes()
 
     def _rebuild_checkboxes(self) -> None:
         """
         Rebuild all checkboxes based on current array's fields.
+
+        Painting is suspended for the rebuild, so the row re-lays out and
+        repaints once rather than once per inserted checkbox.
         """
+        self.checkbox_container.setUpdatesEnabled(False)
+        try:
+            self._populate_checkboxes()
+        finally:
+            self.checkbox_container.setUpdatesEnabled(True)
+
+    def _populate_checkboxes(self) -> None:
         self._clear_checkboxes()
 
         if self.current_array_index is None:
@@ -144,36 +171,38 @@ class ArrayFieldVisibilityRow:
         if not fields:
             return
 
-        # Create checkbox for each field
-        for field_name in fields:
+        # Create checkbox for each field. The layout holds only the stretch
+        # after the clear, so each field's position is its index
+        for position, field_name in enumerate(fields):
             is_plotted = self.array_field_manager.is_field_active(
                 self.current_array_index, field_name
             )
 
-            # Create checkbox
-            checkbox = QCheckBox(field_name)
+            # Reuse a checkbox from an earlier array when one is free
+            if self._freelist:
+                checkbox = self._freelist.pop()
+                checkbox.toggled.disconnect()
+                checkbox.setText(field_name)
+            else:
+                checkbox = QCheckBox(field_name)
             checkbox.setChecked(is_plotted)
 
-            # Connect to handler with field_name captured
-            checkbox.toggled.connect(
-                lambda checked, fname=field_name: self._on_checkbox_toggled(
-                    fname, checked
-                )
-            )
+            # Bind field_name up front; toggled supplies checked
+            checkbox.toggled.connect(partial(self._on_checkbox_toggled, field_name))
 
             # Store reference
             self.checkboxes[field_name] = checkbox
 
             # Add to layout (before the stretch)
-            self.checkbox_layout.insertWidget(
-                self.checkbox_layout.count() - 1, checkbox
-            )
+            self.checkbox_layout.insertWidget(position, checkbox)
+            checkbox.show()
 
     def _clear_checkboxes(self) -> None:
-        """Remove all existing checkboxes from the layout."""
+        """Remove all existing checkboxes from the layout, keeping them for reuse."""
         for checkbox in self.checkboxes.values():
             self.checkbox_layout.removeWidget(checkbox)
-            checkbox.deleteLater()
+            checkbox.hide()
+            self._freelist.append(checkbox)
 
         self.checkboxes.clear()
 
@@ -199,11 +228,6 @@ class ArrayFieldVisibilityRow:
             checked,
         )
 
-        action = "enabled" if checked else "disabled"
-        print(
-            f"[INFO] Field '{field_name}' {action} for array {self.current_array_index}"
-        )
-
     def sync_checkbox_state(
         self,
         field_name: str,
@@ -218,21 +242,25 @@ class ArrayFieldVisibilityRow:
         """
         if field_name in self.checkboxes:
             checkbox = self.checkboxes[field_name]
-            checkbox.blockSignals(True)
-            checkbox.setChecked(checked)
-            checkbox.blockSignals(False)
+            with QSignalBlocker(checkbox):
+                checkbox.setChecked(checked)
 
     def sync_all_checkboxes(self) -> None:
         """
         Synchronize all checkbox states with ArrayFieldManager.
+
+        Painting is suspended for the loop so the row repaints once.
         """
         if self.current_array_index is None:
             return
 
-        for field_name, checkbox in self.checkboxes.items():
-            is_plotted = self.array_field_manager.is_field_active(
-                self.current_array_index, field_name
-            )
-            checkbox.blockSignals(True)
-            checkbox.setChecked(is_plotted)
-            checkbox.blockSignals(False)
+        self.checkbox_container.setUpdatesEnabled(False)
+        try:
+            for field_name, checkbox in self.checkboxes.items():
+                is_plotted = self.array_field_manager.is_field_active(
+                    self.current_array_index, field_name
+                )
+                with QSignalBlocker(checkbox):
+                    checkbox.setChecked(is_plotted)
+        finally:
+            self.checkbox_container.setUpdatesEnabled(True)
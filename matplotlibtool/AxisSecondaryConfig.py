@@ -9,14 +9,72 @@ unit scaling using the pint library for proper unit conversion.
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-
-from pint import UnitRegistry
+from functools import cache
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 from .AxisType import AxisType
 
-# Initialize unit registry as module-level singleton
-ureg = UnitRegistry()
+if TYPE_CHECKING:
+    from pint import UnitRegistry
+
+# Extended unit map including time units: display unit -> pint name
+_UNIT_MAP = MappingProxyType(
+    {
+        "V": "volt",
+        "v": "volt",
+        "A": "ampere",
+        "a": "ampere",
+        "Hz": "hertz",
+        "hz": "hertz",
+        "s": "second",
+        "S": "second",
+        "t": "second",
+        "ms": "millisecond",
+        "us": "microsecond",
+        "µs": "microsecond",
+        "ns": "nanosecond",
+    }
+)
+
+
+@cache
+def _get_ureg() -> UnitRegistry:
+    """
+    Return the shared unit registry, creating it on first use.
+
+    Importing pint and parsing its unit definitions is slow, so it is
+    deferred until a config with a unit is actually built.
+    """
+    from pint import UnitRegistry
+
+    return UnitRegistry()
+
+
+@lru_cache(maxsize=128)
+def _resolve_compact(
+    decade: int,
+    base_unit_name: str,
+) -> tuple[float, str]:
+    """
+    Resolve the compact display unit for values of a given decade.
+
+    pint picks the compact prefix from the order of magnitude alone, so
+    every value in one decade shares the same factor and unit string.
+
+    Args:
+        decade: floor(log10(abs(value))) of the reference value
+        base_unit_name: pint name of the base unit
+
+    Returns:
+        Tuple of (conversion_factor, unit_string)
+    """
+    ref = 10.0**decade
+    q_compact = (ref * getattr(_get_ureg(), base_unit_name)).to_compact()
+    return q_compact.magnitude / ref, format(q_compact.units, "~")
 
 
 @dataclass
@@ -32,31 +90,17 @@ class AxisSecondaryConfig:
 
     def __post_init__(self):
         """Initialize pint quantity if unit is specified."""
-        self._ureg = ureg
+        self._ureg = None
         self._base_unit = None
-
-        # Extended unit map including time units
-        unit_map = {
-            "V": "volt",
-            "v": "volt",
-            "A": "ampere",
-            "a": "ampere",
-            "Hz": "hertz",
-            "hz": "hertz",
-            "s": "second",
-            "S": "second",
-            "t": "second",
-            "ms": "millisecond",
-            "us": "microsecond",
-            "µs": "microsecond",
-            "ns": "nanosecond",
-        }
+        self._base_unit_name = ""
 
         # Convert unit to pint-compatible name
-        pint_unit = unit_map.get(self.unit, self.unit.lower())
+        pint_unit = _UNIT_MAP.get(self.unit, self.unit.lower())
 
         if pint_unit:
+            self._ureg = _get_ureg()
             self._base_unit = getattr(self._ureg, pint_unit)
+            self._base_unit_name = pint_unit
 
     @classmethod
     def from_range_mapping(
@@ -141,34 +185,19 @@ class AxisSecondaryConfig:
         if not self.enable_auto_scale or not self._base_unit:
             return value_min, value_max, self.unit, 1.0
 
-        # Create pint quantities
-        q_min = value_min * self._base_unit
-        q_max = value_max * self._base_unit
-
         # Use the maximum absolute value to determine the best scale
         max_abs = max(abs(value_min), abs(value_max))
-        if max_abs == 0:
+        if max_abs == 0 or not math.isfinite(max_abs):
             return value_min, value_max, self.unit, 1.0
 
-        q_ref = max_abs * self._base_unit
-        q_compact = q_ref.to_compact()
-
-        # Get the compact unit
-        compact_unit = q_compact.units
-
-        # Convert both min and max to the same compact unit
-        q_min_scaled = q_min.to(compact_unit)
-        q_max_scaled = q_max.to(compact_unit)
-
-        # Calculate conversion factor
-        conversion_factor = q_compact.magnitude / max_abs if max_abs != 0 else 1.0
-
-        # Format the unit string nicely
-        unit_str = format(compact_unit, "~")
+        # The compact unit depends only on the decade; resolve it once per
+        # decade and scale with plain floats instead of pint quantities
+        decade = math.floor(math.log10(max_abs))
+        conversion_factor, unit_str = _resolve_compact(decade, self._base_unit_name)
 
         return (
-            q_min_scaled.magnitude,
-            q_max_scaled.magnitude,
+            value_min * conversion_factor,
+            value_max * conversion_factor,
             unit_str,
             conversion_factor,
         )
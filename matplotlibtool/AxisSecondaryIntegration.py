@@ -86,12 +86,12 @@ class AxisSecondaryIntegration:
 
             # Set the actual values used for the configuration
             widgets = self.viewer.control_bar_manager.secondary_axis_widgets
-            widgets["primary_min"].setText(str(data_min))
-            widgets["primary_max"].setText(str(data_max))
-            widgets["secondary_min"].setText(str(target_min))
-            widgets["secondary_max"].setText(str(target_max))
-            widgets["label"].setText(label)
-            widgets["unit"].setText(unit)
+            widgets.primary_min.setText(str(data_min))
+            widgets.primary_max.setText(str(data_max))
+            widgets.secondary_min.setText(str(target_min))
+            widgets.secondary_max.setText(str(target_max))
+            widgets.label.setText(label)
+            widgets.unit.setText(unit)
 
         self.viewer._update_plot()
         self.viewer.canvas.draw_idle()
@@ -126,12 +126,12 @@ class AxisSecondaryIntegration:
                 widgets = self.viewer.control_bar_manager.secondary_axis_widgets
 
                 try:
-                    primary_min = widgets["primary_min"].text().strip()
-                    primary_max = widgets["primary_max"].text().strip()
-                    secondary_min = widgets["secondary_min"].text().strip()
-                    secondary_max = widgets["secondary_max"].text().strip()
-                    label = widgets["label"].text().strip()
-                    unit = widgets["unit"].text().strip()
+                    primary_min = widgets.primary_min.text().strip()
+                    primary_max = widgets.primary_max.text().strip()
+                    secondary_min = widgets.secondary_min.text().strip()
+                    secondary_max = widgets.secondary_max.text().strip()
+                    label = widgets.label.text().strip()
+                    unit = widgets.unit.text().strip()
 
                     if all(
                         [primary_min, primary_max, secondary_min, secondary_max, label]
@@ -5,13 +5,30 @@ from __future__ import annotations
 
 import time
 from contextlib import contextmanager
+from enum import Enum
 
+from PyQt6.QtCore import QObject
 from PyQt6.QtCore import Qt
 from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QPalette
 from PyQt6.QtWidgets import QLabel
 
 
+class _BusyState(Enum):
+    IDLE = "idle"
+    BUSY = "busy"
+    COOLING = "cooling"  # work finished, indicator held for min_busy_time_ms
+
+
+class _BusySignals(QObject):
+    """Signal hub for the busy indicator."""
+
+    # connected queued, so the busy style is applied on the next event loop
+    # pass instead of inside the caller's start_busy()
+    applyBusyRequested = pyqtSignal()
+
+
 def timestamp():
     """High resolution timestamp for logging."""
     return f"{time.time():.6f}"
@@ -33,25 +50,29 @@ class BusyIndicatorManager:
             status_label: Optional QLabel widget to use as status indicator
         """
         self.status_label = status_label
-        self.is_busy = False
         self.busy_count = 0
+        self._state = _BusyState.IDLE
 
-        # Timer to delay busy indicator to avoid flicker on very fast operations
-        self.busy_timer = QTimer()
-        self.busy_timer.setSingleShot(True)
-        self.busy_timer.timeout.connect(self._show_busy_immediate)
-        self.busy_delay_ms = 0
-
-        # Timer to ensure minimum busy display time for visibility
-        self.min_busy_timer = QTimer()
-        self.min_busy_timer.setSingleShot(True)
-        self.min_busy_timer.timeout.connect(self._hide_busy_immediate)
+        # Single timer: only runs while COOLING, to keep the indicator up
+        # long enough to be seen
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._hide_busy_immediate)
         self.min_busy_time_ms = 1000
 
-        self._pending_hide = False
+        self._signals = _BusySignals()
+        self._signals.applyBusyRequested.connect(
+            self._apply_busy_if_shown, Qt.ConnectionType.QueuedConnection
+        )
 
         self.original_palette = None
 
+        # Busy colors built once, not on every busy transition
+        self.busy_palette = QPalette()
+        self.busy_palette.setColor(QPalette.ColorRole.Window, Qt.GlobalColor.black)
+        self.busy_palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.white)
+        self.busy_palette.setColor(QPalette.ColorRole.Base, Qt.GlobalColor.black)
+
     def set_status_label(self, label: QLabel) -> None:
         """Set the status label widget - REQUIRED for operations."""
         if label is None:
@@ -63,6 +84,11 @@ class BusyIndicatorManager:
         self.original_palette = label.palette()
         self._apply_idle_style()
 
+    @property
+    def is_busy(self) -> bool:
+        """True while the busy indicator is shown."""
+        return self._state is not _BusyState.IDLE
+
     def _require_status_label(self) -> None:
         """Internal method to ensure status label is connected before operations."""
         if self.status_label is None:
@@ -85,7 +111,10 @@ class BusyIndicatorManager:
                 # Do expensive operation
                 update_plot()
         """
-        self.start_busy(operation_name)
+        # The body runs synchronously on the GUI thread, so a posted style
+        # would only apply after it; style the label before it starts
+        self._require_status_label()
+        self._start_busy(operation_name, immediate=True)
         try:
             yield
         finally:
@@ -101,74 +130,62 @@ class BusyIndicatorManager:
         self._require_status_label()
         self._end_busy(operation_name)
 
-    def _start_busy(self, operation_name: str) -> None:
-        """Start a busy operation."""
+    def _start_busy(self, operation_name: str, immediate: bool = False) -> None:
+        """Start a busy operation; immediate applies the busy style synchronously."""
         self.busy_count += 1
 
         if self.busy_count == 1:
-            self._pending_hide = False
-
-            if not self.is_busy:
-                if self.busy_delay_ms == 0:
-                    self._show_busy_immediate()
-                else:
-                    self.busy_timer.start(self.busy_delay_ms)
+            if self._state is _BusyState.COOLING:
+                # still shown: cancel the pending hide
+                self._timer.stop()
+                self._state = _BusyState.BUSY
+            elif self._state is _BusyState.IDLE:
+                self._show_busy_immediate(immediate)
 
     def _end_busy(self, operation_name: str) -> None:
         """End a busy operation."""
         self.busy_count = max(0, self.busy_count - 1)
 
-        if self.busy_count == 0:
-            self.busy_timer.stop()
+        if self.busy_count == 0 and self._state is _BusyState.BUSY:
+            self._state = _BusyState.COOLING
+            self._timer.start(self.min_busy_time_ms)
 
-            if self.is_busy:
-                self._pending_hide = True
-                if not self.min_busy_timer.isActive():
-                    self.min_busy_timer.start(self.min_busy_time_ms)
+    def _show_busy_immediate(self, immediate: bool = False) -> None:
+        """
+        Enter the busy state now and apply or post the busy style.
 
-    def _show_busy_immediate(self) -> None:
-        """Show busy indicator immediately."""
-        if self.busy_count > 0 and not self.is_busy:
-            self.is_busy = True
+        is_busy is true on return. Unless immediate, the label restyle is left
+        to the event loop so a caller that returns to it (start_busy before
+        work handed to another thread) is not delayed by it.
+        """
+        if self.busy_count > 0 and self._state is _BusyState.IDLE:
+            self._state = _BusyState.BUSY
+            if immediate:
+                self._apply_busy_style()
+            else:
+                self._signals.applyBusyRequested.emit()
+
+    def _apply_busy_if_shown(self) -> None:
+        """Apply the posted busy style unless the indicator was hidden since."""
+        if self._state is not _BusyState.IDLE:
             self._apply_busy_style()
 
     def _hide_busy_immediate(self) -> None:
         """Hide busy indicator immediately."""
-        if self._pending_hide:
-            self.is_busy = False
-            self._pending_hide = False
+        if self._state is _BusyState.COOLING:
+            self._state = _BusyState.IDLE
             self._apply_idle_style()
 
     def _apply_busy_style(self) -> None:
         """Apply busy visual style using QPalette (bypasses CSS)."""
         self._require_status_label()
 
-        # Use QPalette to bypass CSS completely
-        busy_palette = QPalette()
-        busy_palette.setColor(QPalette.ColorRole.Window, Qt.GlobalColor.black)
-        busy_palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.white)
-        busy_palette.setColor(QPalette.ColorRole.Base, Qt.GlobalColor.black)
-
         self.status_label.setText("BUSY")
-        self.status_label.setPalette(busy_palette)
+        self.status_label.setPalette(self.busy_palette)
         self.status_label.setAutoFillBackground(True)
 
-        # Also try stylesheet with maximum specificity
-        self.status_label.setStyleSheet(
-            """
-            QLabel {
-                background-color: #000000 !important;
-                color: #ffffff !important;
-                border: 2px solid #333333 !important;
-                border-radius: 4px !important;
-                padding: 4px 8px !important;
-                font-weight: bold !important;
-                font-size: 10px !important;
-            }
-        """
-        )
-
-        self.status_label.update()
+        # Paint now: the idle->busy edge is followed by blocking work, so a
+        # coalesced update() would only paint once that work is done
         self.status_label.repaint()
 
     def _apply_idle_style(self) -> None:
@@ -182,8 +199,4 @@ class BusyIndicatorManager:
         self.status_label.setAutoFillBackground(False)
         self.status_label.setText("")
 
-        # Clear any custom stylesheet
-        self.status_label.setStyleSheet("")
-
         self.status_label.update()
-        self.status_label.repaint()
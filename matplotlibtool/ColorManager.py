@@ -94,7 +94,7 @@ def make_colors_from_scalar(
     elif backend == "datoviz":
         import datoviz as dvz
 
-        s = color_norm.astype(np.float32)
+        s = np.asarray(color_norm, dtype=np.float32)
         return dvz.cmap(colormap, s)
 
     else:
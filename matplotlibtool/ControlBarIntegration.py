@@ -11,13 +11,58 @@ including signal connections, control synchronization, and state updates.
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from typing import Any
 from typing import Dict
 
+from PyQt6.QtCore import QTimer
+
 if TYPE_CHECKING:
+    from .ControlBarManager import ControlBarManager
     from .PointCloud2DViewerMatplotlib import PointCloud2DViewerMatplotlib
 
 
+# control bar signal -> PlotEventHandlers method
+_SIGNAL_BINDINGS: tuple[tuple[str, str], ...] = (
+    # File operations
+    ("addRequested", "on_add_files"),
+    ("saveFigureRequested", "on_save_figure"),
+    # Plot selection and properties
+    ("plotChanged", "on_plot_selection_changed"),
+    ("groupSelectionChanged", "on_group_selection_changed"),
+    ("visibilityToggled", "on_visibility_toggled"),
+    # Rendering controls
+    ("accelChanged", "on_acceleration_changed"),
+    ("sizeChanged", "on_point_size_changed"),
+    ("autoSizeToggled", "on_auto_size_toggled"),
+    ("lineWidthChanged", "on_line_width_changed"),
+    ("linesToggled", "on_lines_toggled"),
+    ("paletteChanged", "on_palette_changed"),
+    ("colorFieldChanged", "on_color_field_changed"),
+    ("darkModeToggled", "on_dark_mode_toggled"),
+    # Analysis controls
+    ("sampleRateChanged", "on_sample_rate_changed"),
+    ("settleToggled", "on_settle_toggled"),
+    ("analyzeToggled", "on_analyze_toggled"),
+    ("fftRequested", "on_fft"),
+    ("pixelsRequested", "on_pixels"),
+    ("pixelDcToggled", "on_pixel_dc_toggled"),
+    ("peaksToggled", "on_peaks_toggled"),
+    ("saveDataRequested", "on_save_data"),
+    # Grid controls
+    ("gridSpacingChanged", "on_grid_changed"),
+    ("axesGridColorPickRequested", "on_pick_axes_grid_color"),
+    ("adcGridColorPickRequested", "on_pick_grid2n_color"),
+    # View controls
+    ("resetRequested", "reset_view"),
+    ("exitRequested", "immediate_exit"),
+    ("fitViewRequested", "fit_view_to_data"),
+    ("mouseModeChanged", "on_mouse_mode_changed"),
+    ("viewBackRequested", "view_back"),
+    ("viewForwardRequested", "view_forward"),
+    ("viewBoundsChanged", "apply_view_bounds"),
+    ("applyOffsetRequested", "apply_offset_values"),
+)
+
+
 class ControlBarIntegration:
     """
     Manages control bar integration for the 2D matplotlib viewer.
@@ -30,6 +75,24 @@ class ControlBarIntegration:
     - Color field dropdown synchronization
     """
 
+    # Sits on every selection, view and info update; fixed attributes keep
+    # the instance free of a __dict__
+    __slots__ = (
+        "viewer",
+        "_secondary_axis",
+        "_control_bar_manager",
+        "_pending_sync",
+        "_pending_bounds",
+        "_pending_count",
+        "_sync_timer",
+        "_last_bounds",
+        "_color_field_state",
+        "_grid_colors",
+        "_info_text",
+        "_point_count",
+        "_point_count_text",
+    )
+
     def __init__(self, viewer: PointCloud2DViewerMatplotlib):
         """
         Initialize control bar integration.
@@ -39,66 +102,104 @@ class ControlBarIntegration:
         """
         self.viewer = viewer
 
+        # Fixed once the viewer is constructed; None if it has no secondary axis
+        self._secondary_axis = getattr(viewer, "secondary_axis", None)
+
+        # Bound once the viewer's UI exists; None until then
+        self._control_bar_manager: ControlBarManager | None = None
+
+        # Selection syncs and bounds updates requested within one event loop
+        # pass (a pan or zoom gesture, a burst of selection changes) are
+        # coalesced into a single update of the controls
+        self._pending_sync = False
+        self._pending_bounds = False
+        self._pending_count: int | None = None
+        self._sync_timer = QTimer()
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(0)
+        self._sync_timer.timeout.connect(self._flush_pending)
+
+        # Bounds last written to the view fields, at the fields' display
+        # precision, to skip rewrites the user could not see
+        self._last_bounds: tuple[str, str, str, str] | None = None
+
+        # (field names, selected field) last put in the color field dropdown
+        self._color_field_state: tuple[tuple[str, ...], str | None] | None = None
+
+        # (axes grid, ADC grid) colors last drawn into the button swatches
+        self._grid_colors: tuple[str, str] | None = None
+
+        # Info label text last set, and the last point count with its
+        # formatted text, so repeated updates skip formatting and setText
+        self._info_text: str | None = None
+        self._point_count: int | None = None
+        self._point_count_text = ""
+
     def connect_signals(self) -> None:
         """Connect all control bar signals to their handlers."""
-        signal_map = {
-            # File operations
-            "addRequested": self.viewer.event_handlers.on_add_files,
-            "saveFigureRequested": self.viewer.event_handlers.on_save_figure,
-            # Plot selection and properties
-            "plotChanged": self.viewer.event_handlers.on_plot_selection_changed,
-            "groupSelectionChanged": self.viewer.event_handlers.on_group_selection_changed,
-            "visibilityToggled": self.viewer.event_handlers.on_visibility_toggled,
-            # Rendering controls
-            "accelChanged": self.viewer.event_handlers.on_acceleration_changed,
-            "sizeChanged": self.viewer.event_handlers.on_point_size_changed,
-            "autoSizeToggled": self.viewer.event_handlers.on_auto_size_toggled,
-            "lineWidthChanged": self.viewer.event_handlers.on_line_width_changed,
-            "linesToggled": self.viewer.event_handlers.on_lines_toggled,
-            "paletteChanged": self.viewer.event_handlers.on_palette_changed,
-            "colorFieldChanged": self.viewer.event_handlers.on_color_field_changed,
-            "darkModeToggled": self.viewer.event_handlers.on_dark_mode_toggled,
-            # Analysis controls
-            "sampleRateChanged": self.viewer.event_handlers.on_sample_rate_changed,
-            "settleToggled": self.viewer.event_handlers.on_settle_toggled,
-            "analyzeToggled": self.viewer.event_handlers.on_analyze_toggled,
-            "fftRequested": self.viewer.event_handlers.on_fft,
-            "pixelsRequested": self.viewer.event_handlers.on_pixels,
-            "pixelDcToggled": self.viewer.event_handlers.on_pixel_dc_toggled,
-            "peaksToggled": self.viewer.event_handlers.on_peaks_toggled,
-            "saveDataRequested": self.viewer.event_handlers.on_save_data,
-            # Grid controls
-            "gridSpacingChanged": self.viewer.event_handlers.on_grid_changed,
-            "axesGridColorPickRequested": self.viewer.event_handlers.on_pick_axes_grid_color,
-            "adcGridColorPickRequested": self.viewer.event_handlers.on_pick_grid2n_color,
-            # View controls
-            "resetRequested": self.viewer.event_handlers.reset_view,
-            "exitRequested": self.viewer.event_handlers.immediate_exit,
-            "fitViewRequested": self.viewer.event_handlers.fit_view_to_data,
-            "mouseModeChanged": self.viewer.event_handlers.on_mouse_mode_changed,
-            "viewBackRequested": self.viewer.event_handlers.view_back,
-            "viewForwardRequested": self.viewer.event_handlers.view_forward,
-            "applyViewRequested": self.viewer.event_handlers.apply_view_bounds,
-            "applyOffsetRequested": self.viewer.event_handlers.apply_offset_values,
-        }
-
-        # Add secondary axis signals from the integration module
-        if hasattr(self.viewer, "secondary_axis"):
-            signal_map.update(self.viewer.secondary_axis.connect_signals())
-
-        self.viewer.control_bar_manager.connect_signals(signal_map)
+        self._bind_control_bar()
+
+        handlers = self.viewer.event_handlers
+
+        # Secondary axis signals come from the integration module
+        secondary_axis = self._secondary_axis
+        secondary = (
+            secondary_axis.connect_signals() if secondary_axis is not None else {}
+        )
+
+        self._control_bar_manager.connect_signals(
+            {
+                **{
+                    signal: getattr(handlers, name)
+                    for signal, name in _SIGNAL_BINDINGS
+                },
+                **secondary,
+            }
+        )
+
+        # A submitted bound may be rejected (unparsable, or min >= max) and
+        # left in its field, so the fields no longer show _last_bounds
+        for name in ("xmin_edit", "xmax_edit", "ymin_edit", "ymax_edit"):
+            self._control_bar_manager.get_widget(name).returnPressed.connect(
+                self._forget_view_bounds
+            )
+
+    def _forget_view_bounds(self) -> None:
+        self._last_bounds = None
 
     def sync_controls_to_selection(self) -> None:
         """Synchronize control values to currently selected plot(s) or group."""
-        if not self._has_control_bar():
+        self._pending_sync = True
+        self._sync_timer.start()
+
+    def update_view_bounds_display(self) -> None:
+        """Update the view bounds text fields with current values."""
+        self._pending_bounds = True
+        self._sync_timer.start()
+
+    def _flush_pending(self) -> None:
+        """Run the coalesced selection sync, bounds and point count updates."""
+        sync, bounds = self._pending_sync, self._pending_bounds
+        count = self._pending_count
+        self._pending_sync = self._pending_bounds = False
+        self._pending_count = None
+        if sync:
+            self._sync_controls_now()
+        if bounds:
+            self._update_view_bounds_now()
+        if count is not None:
+            self._update_point_count_now(count)
+
+    def _sync_controls_now(self) -> None:
+        if self._control_bar_manager is None:
             return
 
         props = self.viewer.plot_manager.get_selected_plot_properties()
         if not props:
             return
 
-        # Sync basic plot properties (handles "mixed" values)
-        self._sync_plot_properties(props)
+        # Sync basic plot properties (handles "mixed" values) in one batch
+        self._control_bar_manager.apply_plot_properties(props)
 
         # Sync grid colors
         self._sync_grid_colors()
@@ -107,130 +208,95 @@ class ControlBarIntegration:
         self._sync_color_field_dropdown()
 
         # Sync secondary axis state
-        if hasattr(self.viewer, "secondary_axis"):
-            self.viewer.secondary_axis.sync_ui_state()
+        if self._secondary_axis is not None:
+            self._secondary_axis.sync_ui_state()
 
         # Update view bounds display
-        self.update_view_bounds_display()
-
-    def _sync_plot_properties(self, props: dict[str, Any]) -> None:
-        """Sync plot-specific properties to controls (handles mixed values)."""
-        manager = self.viewer.control_bar_manager
-
-        if props["size"] == "mixed":
-            manager.set_point_size_mixed()
-        else:
-            manager.set_point_size(props["size"])
-
-        # a mixed selection leaves auto off, since the checkbox has no third
-        # state and the size field must stay editable for the manual members
-        manager.set_auto_size_checked(props["auto_size"] is True)
-
-        if props.get("line_width") == "mixed":
-            manager.set_line_width_mixed()
-        elif "line_width" in props:
-            manager.set_line_width(props["line_width"])
-
-        if props["draw_lines"] == "mixed":
-            manager.set_lines_tristate()
-        else:
-            manager.set_lines_checked(props["draw_lines"])
-
-        if props["colormap"] == "mixed":
-            manager.set_selected_palette_mixed()
-        else:
-            manager.set_selected_palette(props["colormap"])
-
-        manager.set_palette_enabled(props["has_color_data"] not in [False, "mixed"])
-
-        if props["offset_x"] == "mixed" or props["offset_y"] == "mixed":
-            manager.set_offset_mixed()
-        else:
-            manager.set_offset(props["offset_x"], props["offset_y"])
-
-        if props["visible"] == "mixed":
-            manager.set_visibility_tristate()
-        else:
-            manager.set_visibility_checked(props["visible"])
+        self._update_view_bounds_now()
 
     def _sync_color_field_dropdown(self) -> None:
         """Synchronize color field dropdown with current selection."""
-        if not self._has_control_bar():
+        if self._control_bar_manager is None:
             return
 
+        plot_manager = self.viewer.plot_manager
+        field_integration = self.viewer.array_field_integration
+
         # Check if we have a single plot selected or group
-        if self.viewer.plot_manager.is_group_selected():
-            group_id = self.viewer.plot_manager.selected_group_id
-            group_info = self.viewer.plot_manager.get_group_info(group_id)
+        if plot_manager.is_group_selected():
+            group_info = plot_manager.get_group_info(plot_manager.selected_group_id)
             if not group_info or not group_info.plot_indices:
                 return
 
             plot_index = group_info.plot_indices[0]
         else:
-            plot_index = self.viewer.plot_manager.selected_plot_index
+            plot_index = plot_manager.selected_plot_index
 
         # Get the array index for this plot to find available fields
-        array_index = self.viewer.array_field_integration.array_index_for_plot(
-            plot_index
-        )
+        array_index = field_integration.array_index_for_plot(plot_index)
+        field_manager = field_integration.array_field_manager
 
-        if (
-            array_index is not None
-            and self.viewer.array_field_integration.array_field_manager
-        ):
-            array_info = (
-                self.viewer.array_field_integration.array_field_manager.get_array_info(
-                    array_index
-                )
-            )
+        if array_index is not None and field_manager:
+            array_info = field_manager.get_array_info(array_index)
             if array_info:
-                data = array_info["data"]
-                field_names = list(data.dtype.names)
+                # names tuple captured at registration; no dtype access here
+                field_names = array_info["field_names"]
 
                 current_color_field = array_info["properties"].get("color_field")
 
-                self.viewer.control_bar_manager.populate_color_field_combo(
-                    field_names, current_color_field
-                )
+                self._populate_color_fields(field_names, current_color_field)
                 return
 
         # No valid selection - clear dropdown
-        self.viewer.control_bar_manager.populate_color_field_combo([], None)
+        self._populate_color_fields((), None)
+
+    def _populate_color_fields(
+        self,
+        field_names: tuple[str, ...],
+        current_color_field: str | None,
+    ) -> None:
+        """Repopulate the color field dropdown unless it already shows this."""
+        state = (field_names, current_color_field)
+        if state == self._color_field_state:
+            return
+        self._color_field_state = state
+        self._control_bar_manager.populate_color_field_combo(
+            field_names, current_color_field
+        )
 
     def refresh_plot_selector(self) -> None:
         """Update plot selector combobox with current arrays and groups."""
-        self.viewer.control_bar_manager.populate_hierarchical_dropdown(
+        self._control_bar_manager.populate_hierarchical_dropdown(
             self.viewer.plot_manager
         )
 
-        combo = self.viewer.control_bar_manager.get_widget("plot_combo")
-        combo.update()
-        combo.repaint()
-
-    def update_view_bounds_display(self) -> None:
-        """Update the view bounds text fields with current values."""
-        if not self._has_control_bar():
+    def _update_view_bounds_now(self) -> None:
+        if self._control_bar_manager is None:
             return
 
         current_bounds = self.viewer.view_manager.get_current_bounds()
-        self.viewer.control_bar_manager.set_view_bounds(
-            current_bounds.xlim[0],
-            current_bounds.xlim[1],
-            current_bounds.ylim[0],
-            current_bounds.ylim[1],
-        )
+        bounds = (*current_bounds.xlim, *current_bounds.ylim)
+        shown = tuple(f"{value:.6g}" for value in bounds)
+        if shown == self._last_bounds:
+            return
+        self._last_bounds = shown
+        self._control_bar_manager.set_view_bounds(*bounds)
 
     def set_initial_state(self) -> None:
         """Set initial control states after UI is created."""
-        self.refresh_plot_selector()
-
-        # Sync controls to current selection (if any plots exist)
-        if self.viewer.plot_manager.get_plot_count() > 0:
-            self.sync_controls_to_selection()
+        manager = self._control_bar_manager
+        with manager.batch_updates():
+            self.refresh_plot_selector()
 
-        self.viewer.control_bar_manager.set_accel(self.viewer.acceleration)
+            # Sync controls to current selection (if any plots exist).
+            # Done directly so the values land inside this batch rather
+            # than in a second pass once the sync timer fires.
+            if self.viewer.plot_manager.get_plot_count() > 0:
+                self._pending_sync = False
+                self._sync_controls_now()
 
-        self.viewer.control_bar_manager.set_dark_mode_checked(self.viewer.dark_mode)
+            manager.set_accel(self.viewer.acceleration)
+            manager.set_dark_mode_checked(self.viewer.dark_mode)
 
     def update_info_text(self, text: str) -> None:
         """
@@ -239,39 +305,51 @@ class ControlBarIntegration:
         Args:
             text: Text to display in info label
         """
-        if self._has_control_bar():
-            self.viewer.control_bar_manager.set_info_text(text)
+        if self._control_bar_manager is not None and text != self._info_text:
+            self._info_text = text
+            self._control_bar_manager.set_info_text(text)
 
     def update_point_count(self, count: int) -> None:
         """
         Update point count display.
 
+        A burst of counts, such as while streaming points in, is coalesced
+        with the other control updates into one label write.
+
         Args:
             count: Number of points to display
         """
-        self.update_info_text(f"{count:,} pts")
+        self._pending_count = count
+        self._sync_timer.start()
+
+    def _update_point_count_now(self, count: int) -> None:
+        if count != self._point_count:
+            self._point_count = count
+            self._point_count_text = f"{count:,} pts"
+        self.update_info_text(self._point_count_text)
 
-    def _has_control_bar(self) -> bool:
+    def _bind_control_bar(self) -> None:
         """
-        Check if control bar manager is initialized.
+        Cache the viewer's control bar manager.
 
-        Returns:
-            True if control bar manager exists
+        Called once the UI is built, so the per-update guards are a single
+        attribute test instead of hasattr plus getattr on the viewer.
         """
-        return (
-            hasattr(self.viewer, "control_bar_manager")
-            and self.viewer.control_bar_manager is not None
-        )
+        self._control_bar_manager = getattr(self.viewer, "control_bar_manager", None)
 
     def _sync_grid_colors(self) -> None:
         """Synchronize grid color button swatches with current values."""
-        if not self._has_control_bar():
+        if self._control_bar_manager is None:
             return
 
-        self.viewer.control_bar_manager.set_axes_grid_color_swatch(
-            self.viewer.axes_grid_color
-        )
-
-        self.viewer.control_bar_manager.set_adc_grid_color_swatch(
-            self.viewer.grid_color
-        )
+        axes_color = self.viewer.axes_grid_color
+        adc_color = self.viewer.grid_color
+        last_axes, last_adc = self._grid_colors or (None, None)
+        self._grid_colors = (axes_color, adc_color)
+
+        # each swatch is a button stylesheet reparse; skip the unchanged ones
+        manager = self._control_bar_manager
+        if axes_color != last_axes:
+            manager.set_axes_grid_color_swatch(axes_color)
+        if adc_color != last_adc:
+            manager.set_adc_grid_color_swatch(adc_color)
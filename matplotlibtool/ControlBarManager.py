@@ -3,23 +3,84 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Callable
+from collections.abc import Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any
 
 from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QStringListModel
 from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QTimer
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QCheckBox
 from PyQt6.QtGui import QIntValidator
+from PyQt6.QtGui import QStandardItem
+from PyQt6.QtGui import QStandardItemModel
 from PyQt6.QtWidgets import QComboBox
 from PyQt6.QtWidgets import QDoubleSpinBox
 from PyQt6.QtWidgets import QHBoxLayout
 from PyQt6.QtWidgets import QLabel
 from PyQt6.QtWidgets import QLineEdit
+from PyQt6.QtWidgets import QListView
 from PyQt6.QtWidgets import QPushButton
 from PyQt6.QtWidgets import QVBoxLayout
 from PyQt6.QtWidgets import QWidget
 
 from .AxisSecondaryConfig import AxisSecondaryConfig
+from .PlotGroupModel import PlotGroupModel
+from .PlotManager import MIXED
+
+# Item data role marking combo rows that are not selectable values
+# (palette category headers, the hidden "(Mixed)" row)
+_DIVIDER_ROLE = Qt.ItemDataRole.UserRole + 1
+
+_VIEW_BOUND_FIELDS = ("xmin_edit", "xmax_edit", "ymin_edit", "ymax_edit")
+
+
+def _field_float(edit: QLineEdit) -> float | None:
+    """Value of a numeric line edit, or None when it is blank."""
+    # float() accepts surrounding whitespace, so no strip() copy is needed
+    text = edit.text()
+    if not text or text.isspace():
+        return None
+    return float(text)
+
+
+@dataclass(slots=True)
+class SecondaryAxisWidgets:
+    """Secondary Y-axis controls. The range editors stay None until built."""
+
+    enable: QCheckBox | None = None
+    primary_min: QLineEdit | None = None
+    primary_max: QLineEdit | None = None
+    secondary_min: QLineEdit | None = None
+    secondary_max: QLineEdit | None = None
+    label: QLineEdit | None = None
+    unit: QLineEdit | None = None
+    apply: QPushButton | None = None
+
+    def line_edits(self) -> tuple[QLineEdit, ...]:
+        """The range, label and unit fields, or () before they are built."""
+        if self.primary_min is None:
+            return ()
+        return (
+            self.primary_min,
+            self.primary_max,
+            self.secondary_min,
+            self.secondary_max,
+            self.label,
+            self.unit,
+        )
+
+    def editors(self) -> tuple[QWidget, ...]:
+        """Every built control the enable checkbox switches on and off."""
+        if self.apply is None:
+            return ()
+        return (*self.line_edits(), self.apply)
 
 
 class ControlBarSignals(QObject):
@@ -66,15 +127,14 @@ class ControlBarSignals(QObject):
     mouseModeChanged = pyqtSignal(str)
     viewBackRequested = pyqtSignal()
     viewForwardRequested = pyqtSignal()
-    applyViewRequested = pyqtSignal()
     applyOffsetRequested = pyqtSignal()
 
-    # View bounds changed
+    # View bounds entered: xmin, xmax, ymin, ymax (nan = keep current)
     viewBoundsChanged = pyqtSignal(
-        str,
-        str,
-        str,
-        str,
+        float,
+        float,
+        float,
+        float,
     )
 
     # Secondary axis signals
@@ -118,7 +178,21 @@ class ControlBarManager:
         self._block_signals = False
 
         # Secondary axis widgets
-        self.secondary_axis_widgets = {}
+        self.secondary_axis_widgets = SecondaryAxisWidgets()
+        self._secondary_editors: QWidget | None = None
+
+        # Top-level widget from create_controls, for batched updates
+        self._controls_widget: QWidget | None = None
+
+        # Plot/group selector and its model, created in _create_row1
+        self._plot_combo: QComboBox | None = None
+        self._plot_model: PlotGroupModel | None = None
+        # Set while the selector is repopulated; its slot ignores changes
+        self._rebuilding = False
+
+        # Color field combo model and the names it currently lists
+        self._color_field_model: QStringListModel | None = None
+        self._color_field_names: list[str] = []
 
     def create_four_row_controls(self) -> QWidget:
         """
@@ -194,16 +268,12 @@ class ControlBarManager:
         Args:
             plot_manager: PlotManager instance with group and plot info
         """
-        combo = self.widgets["plot_combo"]
+        combo = self._plot_combo
         if combo is None:
             return
 
-        combo.blockSignals(True)
-
         old_selection_data = combo.currentData()
 
-        combo.clear()
-
         current_selection_type = None
         current_selection_id = None
 
@@ -218,88 +288,35 @@ class ControlBarManager:
 
         groups = plot_manager.get_all_groups()
 
-        grouped_plot_indices = set()
-        for group_info in groups:
-            grouped_plot_indices.update(group_info.plot_indices)
-
-        selection_index = -1  # Will be set to last group if no specific selection
-        current_index = 0
-        last_group_index = -1  # Track the last group added
-
-        # Add groups with their plots
-        for group_info in groups:
-            # Add group header
-            group_label = (
-                f"📦 {group_info.group_name} ({len(group_info.plot_indices)} plots)"
-            )
-            combo.addItem(group_label)
-            combo.setItemData(current_index, ("group", group_info.group_id))
-
-            if (
-                current_selection_type == "group"
-                and current_selection_id == group_info.group_id
-            ):
-                selection_index = current_index
-
-            last_group_index = current_index  # Track last group
-            current_index += 1
-
-            # Add individual plots in this group (indented)
-            for plot_index in group_info.plot_indices:
-                if plot_index < len(plot_manager.plots):
-                    plot = plot_manager.plots[plot_index]
-                    custom_name = plot_manager.plot_names.get(plot_index, None)
-
-                    if custom_name:
-                        plot_label = f"  └─ {custom_name} ({len(plot.points):,} pts)"
-                    else:
-                        plot_label = (
-                            f"  └─ Plot {plot_index + 1} ({len(plot.points):,} pts)"
-                        )
-
-                    combo.addItem(plot_label)
-                    combo.setItemData(current_index, ("plot", plot_index))
-
-                    if (
-                        current_selection_type == "plot"
-                        and current_selection_id == plot_index
-                    ):
-                        selection_index = current_index
-
-                    current_index += 1
-
-        # Add ungrouped plots (if any)
-        for plot_index in range(len(plot_manager.plots)):
-            if plot_index not in grouped_plot_indices:
-                plot = plot_manager.plots[plot_index]
-                custom_name = plot_manager.plot_names.get(plot_index, None)
-
-                if custom_name:
-                    plot_label = f"{custom_name} ({len(plot.points):,} pts)"
-                else:
-                    plot_label = f"Plot {plot_index + 1} ({len(plot.points):,} pts)"
-
-                combo.addItem(plot_label)
-                combo.setItemData(current_index, ("plot", plot_index))
-
-                if (
-                    current_selection_type == "plot"
-                    and current_selection_id == plot_index
-                ):
-                    selection_index = current_index
-
-                current_index += 1
-
-        # If no specific selection was found, default to last group
-        if selection_index == -1 and last_group_index != -1:
-            selection_index = last_group_index
-        elif selection_index == -1:
-            selection_index = 0  # Fallback to first item if no groups
+        grouped_plot_indices = set(
+            chain.from_iterable(group_info.plot_indices for group_info in groups)
+        )
 
-        # Set the current selection
-        combo.setCurrentIndex(selection_index)
+        ungrouped_plots = [
+            plot_index
+            for plot_index in range(len(plot_manager.plots))
+            if plot_index not in grouped_plot_indices
+        ]
 
-        combo.blockSignals(False)
+        model = self._plot_model
+        self._rebuilding = True
+        combo.setUpdatesEnabled(False)
+        try:
+            # One model reset; labels are formatted only when shown
+            model.reset(plot_manager, groups, ungrouped_plots)
+
+            selection_index = model.row_of(current_selection_type, current_selection_id)
+            # If no specific selection was found, default to last group
+            if selection_index == -1 and model.last_group_row != -1:
+                selection_index = model.last_group_row
+            elif selection_index == -1:
+                selection_index = 0  # Fallback to first item if no groups
+
+            # Set the current selection
+            combo.setCurrentIndex(selection_index)
+        finally:
+            combo.setUpdatesEnabled(True)
+            self._rebuilding = False
 
     def _create_row1(self) -> QWidget:
         """Create first control row: Add, Plot/Group selector, Visible, Accel, Size, Lines, Palette, Color Field."""
@@ -322,9 +339,17 @@ class ControlBarManager:
         layout.addWidget(QLabel("Plot/Group:"))
         plot_combo = QComboBox()
         plot_combo.setMaximumWidth(300)
+        # Virtualized popup over a lazily-labelled model
+        plot_view = QListView()
+        plot_view.setUniformItemSizes(True)
+        plot_view.setLayoutMode(QListView.LayoutMode.Batched)
+        plot_combo.setView(plot_view)
+        self._plot_model = PlotGroupModel(plot_combo)
+        plot_combo.setModel(self._plot_model)
         plot_combo.currentIndexChanged.connect(self._on_plot_group_selection_changed)
         layout.addWidget(plot_combo)
         self.widgets["plot_combo"] = plot_combo
+        self._plot_combo = plot_combo
 
         layout.addWidget(self._field_button)
         self.widgets["field_panel_btn"] = self._field_button
@@ -341,7 +366,14 @@ class ControlBarManager:
         accel_spin.setSingleStep(0.01)
         accel_spin.setDecimals(3)
         accel_spin.setMaximumWidth(80)
-        accel_spin.valueChanged.connect(self.signals.accelChanged.emit)
+        # Arrow and wheel steps arrive in bursts; emit once they settle
+        accel_timer = QTimer(accel_spin)
+        accel_timer.setSingleShot(True)
+        accel_timer.setInterval(50)
+        accel_timer.timeout.connect(
+            lambda: self.signals.accelChanged.emit(accel_spin.value())
+        )
+        accel_spin.valueChanged.connect(lambda _value: accel_timer.start())
         layout.addWidget(accel_spin)
         self.widgets["accel_spin"] = accel_spin
 
@@ -398,7 +430,6 @@ class ControlBarManager:
         palette_combo = QComboBox()
         palette_combo.setMaximumWidth(160)
         self._populate_palette_combo(palette_combo)
-        palette_combo.currentTextChanged.connect(self._on_palette_changed)
         palette_combo.currentIndexChanged.connect(self._on_palette_index_changed)
         layout.addWidget(palette_combo)
         self.widgets["palette_combo"] = palette_combo
@@ -406,28 +437,32 @@ class ControlBarManager:
         layout.addWidget(QLabel("Color:"))
         color_field_combo = QComboBox()
         color_field_combo.setMaximumWidth(120)
-        color_field_combo.currentTextChanged.connect(self._on_color_field_changed)
+        self._color_field_model = QStringListModel(color_field_combo)
+        color_field_combo.setModel(self._color_field_model)
+        color_field_combo.currentIndexChanged.connect(self._on_color_field_changed)
         layout.addWidget(color_field_combo)
         self.widgets["color_field_combo"] = color_field_combo
 
         layout.addStretch()
         return row
 
-    def _on_color_field_changed(self, field_name: str):
+    def _on_color_field_changed(self, index: int):
         """Handle color field selection change."""
-        if field_name and not field_name.startswith("───"):
-            self.signals.colorFieldChanged.emit(field_name)
+        # The "(No fields)" placeholder is the only row when there are none
+        if index < 0 or not self._color_field_names:
+            return
+        self.signals.colorFieldChanged.emit(self._color_field_names[index])
 
     def populate_color_field_combo(
         self,
-        field_names: list[str],
+        field_names: Sequence[str],
         current_field: str | None = None,
     ):
         """
         Populate the color field dropdown with available fields.
 
         Args:
-            field_names: List of field names available for coloring
+            field_names: Field names available for coloring
             current_field: Currently selected color field (or None)
         """
         combo = self.widgets.get("color_field_combo")
@@ -435,20 +470,20 @@ class ControlBarManager:
         if combo is None:
             return
 
+        names = list(field_names)
+        self._color_field_names = names
+
         combo.blockSignals(True)
-        combo.clear()
 
-        if not field_names:
-            combo.addItem("(No fields)")
+        # One model reset for the whole list instead of a row insert per field
+        if not names:
+            self._color_field_model.setStringList(["(No fields)"])
             combo.setEnabled(False)
         else:
-            for field in field_names:
-                combo.addItem(field)
+            self._color_field_model.setStringList(names)
 
-            if current_field and current_field in field_names:
-                idx = combo.findText(current_field)
-                if idx >= 0:
-                    combo.setCurrentIndex(idx)
+            if current_field and current_field in names:
+                combo.setCurrentIndex(names.index(current_field))
 
             combo.setEnabled(True)
 
@@ -467,20 +502,17 @@ class ControlBarManager:
 
         combo.blockSignals(True)
 
-        if field_name:
-            idx = combo.findText(field_name)
-            if idx >= 0:
-                combo.setCurrentIndex(idx)
+        if field_name and field_name in self._color_field_names:
+            combo.setCurrentIndex(self._color_field_names.index(field_name))
 
         combo.blockSignals(False)
 
     def _on_plot_group_selection_changed(self, index: int):
         """Handle hierarchical plot/group selection changes."""
-        combo = self.widgets.get("plot_combo")
-        if not combo or index < 0:
+        if self._rebuilding or index < 0:
             return
 
-        item_data = combo.itemData(index)
+        item_data = self._plot_combo.itemData(index)
 
         if item_data is None:
             return
@@ -751,7 +783,39 @@ class ControlBarManager:
         secondary_enable_chk = QCheckBox("Secondary Y-Axis")
         secondary_enable_chk.toggled.connect(self._on_secondary_axis_toggled)
         layout.addWidget(secondary_enable_chk)
-        self.secondary_axis_widgets["enable"] = secondary_enable_chk
+        self.secondary_axis_widgets.enable = secondary_enable_chk
+
+        # Range editors are built on first enable, see _ensure_secondary_row_built
+        secondary_editors = QWidget()
+        editors_layout = QHBoxLayout(secondary_editors)
+        editors_layout.setContentsMargins(
+            0,
+            0,
+            0,
+            0,
+        )
+        editors_layout.setSpacing(8)
+        layout.addWidget(secondary_editors)
+        self._secondary_editors = secondary_editors
+
+        layout.addStretch()
+
+        clock_label = QLabel("")
+        clock_label.setStyleSheet("font-family: monospace;")
+        clock_label.setToolTip(
+            "Current unix timestamp, so a screenshot carries the time it was taken."
+        )
+        layout.addWidget(clock_label)
+        self.widgets["clock_label"] = clock_label
+
+        return row
+
+    def _ensure_secondary_row_built(self) -> None:
+        """Build the secondary axis range editors the first time they are needed."""
+        if self.secondary_axis_widgets.primary_min is not None:
+            return
+
+        layout = self._secondary_editors.layout()
 
         layout.addWidget(QLabel("Primary:"))
 
@@ -760,7 +824,7 @@ class ControlBarManager:
         primary_min_edit.setMaximumWidth(100)
         primary_min_edit.setEnabled(False)
         layout.addWidget(primary_min_edit)
-        self.secondary_axis_widgets["primary_min"] = primary_min_edit
+        self.secondary_axis_widgets.primary_min = primary_min_edit
 
         layout.addWidget(QLabel("to"))
 
@@ -769,7 +833,7 @@ class ControlBarManager:
         primary_max_edit.setMaximumWidth(100)
         primary_max_edit.setEnabled(False)
         layout.addWidget(primary_max_edit)
-        self.secondary_axis_widgets["primary_max"] = primary_max_edit
+        self.secondary_axis_widgets.primary_max = primary_max_edit
 
         layout.addWidget(QLabel("→"))
 
@@ -780,7 +844,7 @@ class ControlBarManager:
         secondary_min_edit.setMaximumWidth(80)
         secondary_min_edit.setEnabled(False)
         layout.addWidget(secondary_min_edit)
-        self.secondary_axis_widgets["secondary_min"] = secondary_min_edit
+        self.secondary_axis_widgets.secondary_min = secondary_min_edit
 
         layout.addWidget(QLabel("to"))
 
@@ -789,40 +853,28 @@ class ControlBarManager:
         secondary_max_edit.setMaximumWidth(80)
         secondary_max_edit.setEnabled(False)
         layout.addWidget(secondary_max_edit)
-        self.secondary_axis_widgets["secondary_max"] = secondary_max_edit
+        self.secondary_axis_widgets.secondary_max = secondary_max_edit
 
         label_edit = QLineEdit()
         label_edit.setPlaceholderText("Label (e.g., Voltage)")
         label_edit.setMaximumWidth(100)
         label_edit.setEnabled(False)
         layout.addWidget(label_edit)
-        self.secondary_axis_widgets["label"] = label_edit
+        self.secondary_axis_widgets.label = label_edit
 
         unit_edit = QLineEdit()
         unit_edit.setPlaceholderText("Unit (e.g., V)")
         unit_edit.setMaximumWidth(60)
         unit_edit.setEnabled(False)
         layout.addWidget(unit_edit)
-        self.secondary_axis_widgets["unit"] = unit_edit
+        self.secondary_axis_widgets.unit = unit_edit
 
         apply_btn = QPushButton("Apply")
         apply_btn.setMaximumWidth(60)
         apply_btn.clicked.connect(self._on_apply_secondary_axis)
         apply_btn.setEnabled(False)
         layout.addWidget(apply_btn)
-        self.secondary_axis_widgets["apply"] = apply_btn
-
-        layout.addStretch()
-
-        clock_label = QLabel("")
-        clock_label.setStyleSheet("font-family: monospace;")
-        clock_label.setToolTip(
-            "Current unix timestamp, so a screenshot carries the time it was taken."
-        )
-        layout.addWidget(clock_label)
-        self.widgets["clock_label"] = clock_label
-
-        return row
+        self.secondary_axis_widgets.apply = apply_btn
 
     def _create_view_bounds_controls(self) -> list[QWidget]:
         """Create view bounds input controls."""
@@ -832,7 +884,7 @@ class ControlBarManager:
         xmin_edit = QLineEdit()
         xmin_edit.setMaximumWidth(80)
         xmin_edit.setPlaceholderText("auto")
-        xmin_edit.returnPressed.connect(self.signals.applyViewRequested.emit)
+        xmin_edit.returnPressed.connect(self._emit_view_bounds)
         widgets.append(xmin_edit)
         self.widgets["xmin_edit"] = xmin_edit
 
@@ -840,7 +892,7 @@ class ControlBarManager:
         xmax_edit = QLineEdit()
         xmax_edit.setMaximumWidth(80)
         xmax_edit.setPlaceholderText("auto")
-        xmax_edit.returnPressed.connect(self.signals.applyViewRequested.emit)
+        xmax_edit.returnPressed.connect(self._emit_view_bounds)
         widgets.append(xmax_edit)
         self.widgets["xmax_edit"] = xmax_edit
 
@@ -848,7 +900,7 @@ class ControlBarManager:
         ymin_edit = QLineEdit()
         ymin_edit.setMaximumWidth(80)
         ymin_edit.setPlaceholderText("auto")
-        ymin_edit.returnPressed.connect(self.signals.applyViewRequested.emit)
+        ymin_edit.returnPressed.connect(self._emit_view_bounds)
         widgets.append(ymin_edit)
         self.widgets["ymin_edit"] = ymin_edit
 
@@ -856,12 +908,27 @@ class ControlBarManager:
         ymax_edit = QLineEdit()
         ymax_edit.setMaximumWidth(80)
         ymax_edit.setPlaceholderText("auto")
-        ymax_edit.returnPressed.connect(self.signals.applyViewRequested.emit)
+        ymax_edit.returnPressed.connect(self._emit_view_bounds)
         widgets.append(ymax_edit)
         self.widgets["ymax_edit"] = ymax_edit
 
         return widgets
 
+    def _emit_view_bounds(self) -> None:
+        """Parse the four bound fields once and emit them; blanks become nan."""
+        bounds = []
+        for widget_name in _VIEW_BOUND_FIELDS:
+            text = self._get_text_field(widget_name)
+            if not text or text.lower() == "auto":
+                bounds.append(math.nan)
+                continue
+            try:
+                bounds.append(float(text))
+            except ValueError as e:
+                print(f"[ERROR] Invalid number format: {e}")
+                return
+        self.signals.viewBoundsChanged.emit(*bounds)
+
     def _create_offset_controls(self) -> list[QWidget]:
         """Create offset input controls."""
         widgets = []
@@ -892,14 +959,25 @@ class ControlBarManager:
 
     def _populate_palette_combo(self, combo: QComboBox):
         """Populate palette combobox with grouped palettes."""
-        combo.clear()
+        # Parented to the combo so the model goes away with the widget
+        model = QStandardItemModel(combo)
+        items = []
         for category, palettes in self.palette_groups.items():
-            combo.addItem(f"───〖{category}〗───")
-            idx = combo.count() - 1
-            item = combo.model().item(idx)
-            item.setEnabled(False)
-            for p in palettes:
-                combo.addItem(p)
+            header = QStandardItem(f"───〖{category}〗───")
+            header.setFlags(header.flags() & ~Qt.ItemFlag.ItemIsEnabled)
+            header.setData(True, _DIVIDER_ROLE)
+            items.append(header)
+            items.extend(QStandardItem(p) for p in palettes)
+        # Shown only while the selected plots disagree on a palette
+        mixed = QStandardItem("(Mixed)")
+        mixed.setFlags(mixed.flags() & ~Qt.ItemFlag.ItemIsEnabled)
+        mixed.setData(True, _DIVIDER_ROLE)
+        items.append(mixed)
+        # One appendRows call instead of an insert signal per item
+        model.invisibleRootItem().appendRows(items)
+
+        combo.setModel(model)
+        combo.view().setRowHidden(model.rowCount() - 1, True)
 
     def _populate_grid_combo(self, combo: QComboBox):
         """Populate grid spacing combobox."""
@@ -910,42 +988,35 @@ class ControlBarManager:
             combo.addItem(f"2^{n} ({spacing})" if n <= 10 else f"2^{n}")
         combo.setCurrentIndex(0)
 
-    def _on_palette_changed(self, name: str):
-        """Handle text-based palette changes."""
-        if name.startswith("───"):
-            return
-        self.signals.paletteChanged.emit(name)
-
     def _on_palette_index_changed(self, index: int):
         """Handle index-based palette changes."""
         if index < 0:
             return
-        combo = self.widgets.get("palette_combo")
-        if combo:
-            name = combo.itemText(index)
-            if name.startswith("───"):
-                return
-            self.signals.paletteChanged.emit(name)
+        combo = self.widgets["palette_combo"]
+        if combo.itemData(index, _DIVIDER_ROLE):
+            return
+        self.signals.paletteChanged.emit(combo.itemText(index))
 
     def _on_secondary_axis_toggled(self, enabled: bool):
         """Handle secondary axis enable/disable."""
-        for key, widget in self.secondary_axis_widgets.items():
-            if key != "enable":
-                widget.setEnabled(enabled)
+        if enabled:
+            self._ensure_secondary_row_built()
+
+        widgets = self.secondary_axis_widgets
+        for widget in widgets.editors():
+            widget.setEnabled(enabled)
 
         if enabled:
-            if not self.secondary_axis_widgets["primary_min"].text().strip():
-                self.secondary_axis_widgets["primary_min"].setText("-8388608")
-            if not self.secondary_axis_widgets["primary_max"].text().strip():
-                self.secondary_axis_widgets["primary_max"].setText("8388607")
-            if not self.secondary_axis_widgets["secondary_min"].text().strip():
-                self.secondary_axis_widgets["secondary_min"].setText("-5.0")
-            if not self.secondary_axis_widgets["secondary_max"].text().strip():
-                self.secondary_axis_widgets["secondary_max"].setText("5.0")
-            if not self.secondary_axis_widgets["label"].text().strip():
-                self.secondary_axis_widgets["label"].setText("Voltage")
-            if not self.secondary_axis_widgets["unit"].text().strip():
-                self.secondary_axis_widgets["unit"].setText("V")
+            for edit, default in (
+                (widgets.primary_min, "-8388608"),
+                (widgets.primary_max, "8388607"),
+                (widgets.secondary_min, "-5.0"),
+                (widgets.secondary_max, "5.0"),
+                (widgets.label, "Voltage"),
+                (widgets.unit, "V"),
+            ):
+                if not edit.text().strip():
+                    edit.setText(default)
 
         self.signals.secondaryAxisToggled.emit(enabled)
 
@@ -956,39 +1027,34 @@ class ControlBarManager:
 
     def _on_apply_secondary_axis(self):
         """Apply secondary axis configuration."""
+        widgets = self.secondary_axis_widgets
+        label_text = widgets.label.text().strip()
         try:
-            primary_min_text = self.secondary_axis_widgets["primary_min"].text().strip()
-            primary_max_text = self.secondary_axis_widgets["primary_max"].text().strip()
-            secondary_min_text = (
-                self.secondary_axis_widgets["secondary_min"].text().strip()
-            )
-            secondary_max_text = (
-                self.secondary_axis_widgets["secondary_max"].text().strip()
-            )
-            label_text = self.secondary_axis_widgets["label"].text().strip()
-            unit_text = self.secondary_axis_widgets["unit"].text().strip()
-
-            if not all(
-                [
-                    primary_min_text,
-                    primary_max_text,
-                    secondary_min_text,
-                    secondary_max_text,
-                    label_text,
-                ]
-            ):
+            # Parsing stops at the first malformed field
+            values = [
+                _field_float(edit)
+                for edit in (
+                    widgets.primary_min,
+                    widgets.primary_max,
+                    widgets.secondary_min,
+                    widgets.secondary_max,
+                )
+            ]
+
+            if not label_text or None in values:
                 print(
                     "[ERROR] All fields except unit are required for secondary axis configuration"
                 )
                 return
 
+            primary_min, primary_max, secondary_min, secondary_max = values
             config = AxisSecondaryConfig.from_range_mapping(
-                primary_min=float(primary_min_text),
-                primary_max=float(primary_max_text),
-                secondary_min=float(secondary_min_text),
-                secondary_max=float(secondary_max_text),
+                primary_min=primary_min,
+                primary_max=primary_max,
+                secondary_min=secondary_min,
+                secondary_max=secondary_max,
                 label=label_text,
-                unit=unit_text,
+                unit=widgets.unit.text().strip(),
             )
 
             self.signals.secondaryAxisConfigRequested.emit(config)
@@ -1084,29 +1150,21 @@ class ControlBarManager:
         current_index: int = 0,
     ):
         """Set plot selector options."""
-        combo = self.widgets.get("plot_combo")
+        combo = self._plot_combo
         if combo is None:
             return
 
-        combo.blockSignals(True)
-        combo.clear()
-
-        if not labels:
-            combo.addItem("No plots available")
-            combo.setCurrentIndex(0)
-        else:
-            for i, label in enumerate(labels):
-                combo.addItem(label)
-
-            if labels:
+        self._rebuilding = True
+        try:
+            if not labels:
+                self._plot_model.reset_labels(["No plots available"])
+                combo.setCurrentIndex(0)
+            else:
+                self._plot_model.reset_labels(labels)
                 idx = min(max(current_index, 0), len(labels) - 1)
                 combo.setCurrentIndex(idx)
-            else:
-                combo.setCurrentIndex(0)
-
-        combo.blockSignals(False)
-        combo.update()
-        combo.repaint()
+        finally:
+            self._rebuilding = False
 
     def set_accel(self, value: float):
         """Set acceleration value."""
@@ -1236,14 +1294,6 @@ class ControlBarManager:
         self._set_text_field("ymin_edit", f"{ymin:.6g}")
         self._set_text_field("ymax_edit", f"{ymax:.6g}")
 
-    def get_view_bounds(self) -> tuple[str, str, str, str]:
-        """Get current view bounds from text fields."""
-        xmin = self._get_text_field("xmin_edit")
-        xmax = self._get_text_field("xmax_edit")
-        ymin = self._get_text_field("ymin_edit")
-        ymax = self._get_text_field("ymax_edit")
-        return xmin, xmax, ymin, ymax
-
     def get_offset_values(self) -> tuple[float, float]:
         """Get current offset values."""
         x_spin = self.widgets.get("offset_x_spin")
@@ -1256,65 +1306,50 @@ class ControlBarManager:
 
     def set_secondary_axis_enabled(self, enabled: bool):
         """Set secondary axis checkbox state."""
-        chk = self.secondary_axis_widgets.get("enable")
+        chk = self.secondary_axis_widgets.enable
         if chk:
+            if enabled:
+                self._ensure_secondary_row_built()
+
             chk.blockSignals(True)
             chk.setChecked(enabled)
             chk.blockSignals(False)
 
-            for key, widget in self.secondary_axis_widgets.items():
-                if key != "enable":
-                    widget.setEnabled(enabled)
+            for widget in self.secondary_axis_widgets.editors():
+                widget.setEnabled(enabled)
 
     def set_secondary_axis_config(self, config: AxisSecondaryConfig | None):
         """Set secondary axis configuration values."""
+        widgets = self.secondary_axis_widgets
         if config is None:
-            for key in [
-                "primary_min",
-                "primary_max",
-                "secondary_min",
-                "secondary_max",
-                "label",
-                "unit",
-            ]:
-                widget = self.secondary_axis_widgets.get(key)
-                if widget and hasattr(widget, "setText"):
-                    widget.setText("")
+            for edit in widgets.line_edits():
+                edit.setText("")
             return
 
-        widgets = self.secondary_axis_widgets
-
-        if widgets.get("label"):
-            widgets["label"].setText(config.label)
+        self._ensure_secondary_row_built()
 
-        if widgets.get("unit"):
-            widgets["unit"].setText(config.unit)
+        widgets.label.setText(config.label)
+        widgets.unit.setText(config.unit)
 
-        primary_min_text = widgets.get("primary_min", None)
-        primary_max_text = widgets.get("primary_max", None)
-
-        if primary_min_text and primary_min_text.text().strip():
-            primary_min = float(primary_min_text.text())
+        primary_min_text = widgets.primary_min.text().strip()
+        if primary_min_text:
+            primary_min = float(primary_min_text)
         else:
             primary_min = -8388608
-            if widgets.get("primary_min"):
-                widgets["primary_min"].setText(str(primary_min))
+            widgets.primary_min.setText(str(primary_min))
 
-        if primary_max_text and primary_max_text.text().strip():
-            primary_max = float(primary_max_text.text())
+        primary_max_text = widgets.primary_max.text().strip()
+        if primary_max_text:
+            primary_max = float(primary_max_text)
         else:
             primary_max = 8388607
-            if widgets.get("primary_max"):
-                widgets["primary_max"].setText(str(primary_max))
+            widgets.primary_max.setText(str(primary_max))
 
         secondary_min = config.scale * primary_min + config.offset
         secondary_max = config.scale * primary_max + config.offset
 
-        if widgets.get("secondary_min"):
-            widgets["secondary_min"].setText(f"{secondary_min:.3f}")
-
-        if widgets.get("secondary_max"):
-            widgets["secondary_max"].setText(f"{secondary_max:.3f}")
+        widgets.secondary_min.setText(f"{secondary_min:.3f}")
+        widgets.secondary_max.setText(f"{secondary_max:.3f}")
 
     def _apply_color_swatch(
         self,
@@ -1404,8 +1439,28 @@ class ControlBarManager:
         self.layouts["row3"] = row3.layout()
         self.layouts["row4"] = row4.layout()
 
+        self._controls_widget = controls_widget
         return controls_widget
 
+    @contextmanager
+    def batch_updates(self):
+        """
+        Suspend painting of the control bar while several controls change.
+
+        The bar repaints once on exit. Nested batches leave the outermost
+        one in charge.
+        """
+        controls = self._controls_widget
+        if controls is None or not controls.updatesEnabled():
+            yield
+            return
+
+        controls.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            controls.setUpdatesEnabled(True)
+
     def set_point_size_mixed(self):
         """Set point size spinbox to show mixed state."""
         spin = self.widgets.get("size_spin")
@@ -1438,11 +1493,7 @@ class ControlBarManager:
         combo = self.widgets.get("palette_combo")
         if combo:
             combo.blockSignals(True)
-            mixed_index = combo.findText("(Mixed)")
-            if mixed_index < 0:
-                combo.insertItem(0, "(Mixed)")
-                mixed_index = 0
-            combo.setCurrentIndex(mixed_index)
+            combo.setCurrentIndex(combo.findText("(Mixed)"))
             combo.blockSignals(False)
 
     def set_offset_mixed(self):
@@ -1461,3 +1512,50 @@ class ControlBarManager:
             y_spin.setSpecialValueText("Mixed")
             y_spin.setValue(y_spin.minimum())
             y_spin.blockSignals(False)
+
+    # selection property -> (setter for a mixed selection, setter for a value),
+    # held as the functions themselves so a sync does no name lookups
+    _PROPERTY_SETTERS = (
+        ("size", set_point_size_mixed, set_point_size),
+        ("line_width", set_line_width_mixed, set_line_width),
+        ("draw_lines", set_lines_tristate, set_lines_checked),
+        ("colormap", set_selected_palette_mixed, set_selected_palette),
+        ("visible", set_visibility_tristate, set_visibility_checked),
+    )
+
+    def apply_plot_properties(self, props: dict[str, Any]) -> None:
+        """
+        Show a selection's plot properties in the controls as one update.
+
+        Painting of the control bar is suspended for the batch, so the
+        controls re-lay out and repaint once rather than once per setter.
+
+        Args:
+            props: PlotManager.get_selected_plot_properties() result, with
+                MIXED where group members differ
+        """
+        get = props.get
+        offset_x = props["offset_x"]
+        offset_y = props["offset_y"]
+
+        with self.batch_updates():
+            for key, set_mixed, set_value in self._PROPERTY_SETTERS:
+                value = get(key)
+                if value is None:
+                    continue
+                if value is MIXED:
+                    set_mixed(self)
+                else:
+                    set_value(self, value)
+
+            # a mixed selection leaves auto off, since the checkbox has no
+            # third state and the size field must stay editable for the
+            # manual members
+            self.set_auto_size_checked(props["auto_size"] is True)
+
+            self.set_palette_enabled(props["has_color_data"] is True)
+
+            if offset_x is MIXED or offset_y is MIXED:
+                self.set_offset_mixed()
+            else:
+                self.set_offset(offset_x, offset_y)
@@ -95,7 +95,7 @@ class CoordinateTransformEngine:
             scale_factor=scale_factor,
         )
 
-        return transformed.astype(np.float32), params
+        return transformed.astype(np.float32, copy=False), params
 
     def center_points(self, points: np.ndarray) -> tuple[np.ndarray, TransformParams]:
         """
@@ -122,7 +122,7 @@ class CoordinateTransformEngine:
 
         params = TransformParams(transform_type="center", center=center.copy())
 
-        return transformed.astype(np.float32), params
+        return transformed.astype(np.float32, copy=False), params
 
     def raw_points(self, points: np.ndarray) -> tuple[np.ndarray, TransformParams]:
         """
@@ -172,9 +172,63 @@ class CoordinateTransformEngine:
             transformed = working_points - params.center
 
         elif params.transform_type == "raw":
-            transformed = working_points
+            # the only branch without a fresh temporary: always copy
+            return working_points.astype(np.float32)
 
         else:
             raise ValueError(f"Unknown transform type: {params.transform_type}")
 
-        return transformed.astype(np.float32)
+        return transformed.astype(np.float32, copy=False)
+
+    def transform_column(
+        self,
+        values: np.ndarray,
+        params: TransformParams | dict,
+        axis: int,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Apply existing transformation parameters to a single coordinate column.
+
+        Every transform acts on each axis independently, so one column can be
+        transformed without the others. The values are cast to float32 first,
+        as PlotDataProcessor does for a primary plot, so field plots of an
+        array land on the same coordinates as its primary plot; the transform
+        then runs in place in the output, with no intermediate arrays.
+
+        Args:
+            values: (N,) array of coordinates along one axis
+            params: TransformParams object or dict with transformation parameters
+            axis: Axis the values belong to (0 = X, 1 = Y, ...)
+            out: Optional float32 (N,) array to write into, e.g. a column of
+                a preallocated (N, D) points array
+
+        Returns:
+            Transformed float32 column (out, when given)
+        """
+        if isinstance(params, dict):
+            params = TransformParams.from_dict(params)
+
+        if out is None:
+            out = np.empty(len(values), dtype=np.float32)
+
+        if params.transform_type == "normalize":
+            if params.center is None or params.scale_factor is None:
+                raise ValueError("Normalize transform requires center and scale_factor")
+            np.copyto(out, values, casting="unsafe")
+            np.subtract(out, params.center[axis], out=out, casting="unsafe")
+            np.multiply(out, params.scale_factor, out=out, casting="unsafe")
+
+        elif params.transform_type == "center":
+            if params.center is None:
+                raise ValueError("Center transform requires center")
+            np.copyto(out, values, casting="unsafe")
+            np.subtract(out, params.center[axis], out=out, casting="unsafe")
+
+        elif params.transform_type == "raw":
+            np.copyto(out, values, casting="unsafe")
+
+        else:
+            raise ValueError(f"Unknown transform type: {params.transform_type}")
+
+        return out
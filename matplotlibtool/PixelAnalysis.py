@@ -345,7 +345,7 @@ def analyse_pixels(
     pixel = data[pixel_field]
     geometry, starts, ends, usable = measure_dwells(pixel, idle_pixel=idle_pixel)
 
-    value = data[value_field].astype(np.float64)
+    value = np.asarray(data[value_field], dtype=np.float64)
     group_starts = starts[usable]
     matrix = _stack(value, group_starts, geometry.modal_length)
 
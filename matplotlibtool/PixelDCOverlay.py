@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import numpy as np
 from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 
 from .PixelAnalysis import PixelAnalysisError
 from .PixelAnalysis import analyse_pixels
@@ -110,8 +111,10 @@ class PixelDCOverlay:
 
         s = starts[usable]
         e = ends[usable]
-        value = data[value_field].astype(np.float64)
-        csum = np.concatenate(([0.0], np.cumsum(value)))
+        # cumulate straight from the field into a float64 prefix-sum buffer
+        csum = np.empty(len(data) + 1, dtype=np.float64)
+        csum[0] = 0.0
+        np.cumsum(data[value_field], dtype=np.float64, out=csum[1:])
         stop = e if length is None else s + start + length
         self._dc = (csum[stop] - csum[s + start]) / (stop - s - start)
         # the segment covers exactly the averaged records: left edge on the
@@ -158,7 +161,5 @@ class PixelDCOverlay:
 
 
 def _is_dark(ax) -> bool:
-    from matplotlib.colors import to_rgba
-
     r, g, b, _ = to_rgba(ax.get_facecolor())
     return (0.299 * r + 0.587 * g + 0.114 * b) < 0.5
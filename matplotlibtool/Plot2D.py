@@ -40,7 +40,9 @@ from PyQt6.QtWidgets import QVBoxLayout
 from PyQt6.QtWidgets import QWidget
 
 from .ArrayFieldIntegration import ArrayFieldIntegration
+from .AxisSecondaryConfig import AxisSecondaryConfig
 from .AxisSecondaryIntegration import AxisSecondaryIntegration
+from .AxisType import AxisType
 from .BusyIndicatorManager import BusyIndicatorManager
 from .color_paletts import COLOR_PALETTES
 from .ControlBarIntegration import ControlBarIntegration
@@ -548,6 +550,10 @@ class Plot2D(QMainWindow):
             global_color_min=global_color_min,
             global_color_max=global_color_max,
         )
+        if processed.color_data is not None:
+            self.array_field_integration.array_field_manager.cache_field_array(
+                array_index, color_field, processed.color_data
+            )
 
         generated_name = y_field if plot_name is None else plot_name
 
@@ -664,15 +670,9 @@ class Plot2D(QMainWindow):
         else:
             self.ax.set_aspect("equal", adjustable="datalim")
 
-        color_ranges: list[tuple[float, float] | None] = []
-        for i, plot in enumerate(all_plots):
-            if plot.color_data is None or len(plot.color_data) == 0:
-                color_ranges.append(None)
-            else:
-                global_range = self.plot_manager.get_plot_global_color_range(i)
-                color_ranges.append(
-                    global_range if global_range is not None else plot.color_range()
-                )
+        color_ranges = [
+            self._plot_color_range(i, plot) for i, plot in enumerate(all_plots)
+        ]
 
         self.renderer.render(
             self.ax,
@@ -697,6 +697,31 @@ class Plot2D(QMainWindow):
 
         self.secondary_axis.update_after_plot()
 
+    def _update_plot_artist(self, plot_index: int) -> None:
+        """
+        Re-render one scatter-only plot whose points moved vertically, such
+        as after a multiplier change, without rebuilding the other artists.
+        """
+        current_bounds = self.view_manager.get_current_bounds()
+        plot = self.plot_manager.plots[plot_index]
+        self.renderer.render_scatter(
+            self.ax,
+            plot,
+            view_xlim=current_bounds.xlim,
+            view_ylim=current_bounds.ylim,
+            color_range=self._plot_color_range(plot_index, plot),
+            cull_margin=self.cull_margin,
+            max_display_points=self.max_display_points,
+            disable_antialiasing=self.disable_antialiasing,
+        )
+        self.event_handlers.update_pixel_dc(current_bounds.xlim)
+
+    def _plot_color_range(self, plot_index: int, plot) -> tuple[float, float] | None:
+        if plot.color_data is None or len(plot.color_data) == 0:
+            return None
+        global_range = self.plot_manager.get_plot_global_color_range(plot_index)
+        return global_range if global_range is not None else plot.color_range()
+
     # ===== appearance =====
 
     def set_dark_mode(self, enabled: bool):
@@ -805,9 +830,6 @@ class Plot2D(QMainWindow):
         unit: str = "",
     ):
         """Configure secondary axis from data range or frequency."""
-        from .AxisSecondaryConfig import AxisSecondaryConfig
-        from .AxisType import AxisType
-
         axis_type = AxisType.X if axis.lower() == "x" else AxisType.Y
 
         if frequency is not None:
@@ -934,6 +956,7 @@ class Plot2D(QMainWindow):
 
         self.timer.stop()
         self.clock_timer.stop()
+        self.array_field_integration.close()
         super().close()
 
         if self._owns_qapp and self._app is not None:
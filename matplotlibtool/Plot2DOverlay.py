@@ -49,9 +49,13 @@ class Overlay:
         measured in the same scaled-and-offset space the reference was taken in.
         """
         pts = self.points
+        shifted = self.offset_x != 0.0 or self.offset_y != 0.0
         if self.y_scale != 1.0:
             pts = pts * np.array([1.0, self.y_scale], dtype=np.float32)
-        if self.offset_x != 0.0 or self.offset_y != 0.0:
+            if shifted:
+                # offsets land in the scaled copy rather than a second one
+                pts += np.array([self.offset_x, self.offset_y], dtype=np.float32)
+        elif shifted:
             pts = pts + np.array([self.offset_x, self.offset_y], dtype=np.float32)
         if self.settle_ref is None:
             return pts
@@ -76,6 +80,39 @@ class Overlay:
         self._settle_cache = (key, out)
         return out
 
+    def raw_window(
+        self, x0: float, x1: float, y0: float, y1: float
+    ) -> tuple[float, float, float, float]:
+        """
+        A display-space box mapped back onto points, so the renderer can cull
+        before scaling. Not meaningful with settle_ref set.
+        """
+        x0, x1 = x0 - self.offset_x, x1 - self.offset_x
+        y0, y1 = y0 - self.offset_y, y1 - self.offset_y
+        scale = self.y_scale
+        if scale == 0.0:
+            # every point sits at offset_y: all inside or none
+            inf = float("inf")
+            return (x0, x1, -inf, inf) if y0 <= 0.0 <= y1 else (x0, x1, inf, -inf)
+        y0, y1 = y0 / scale, y1 / scale
+        if scale < 0.0:
+            y0, y1 = y1, y0
+        return x0, x1, y0, y1
+
+    def to_display(self, pts: np.ndarray) -> np.ndarray:
+        """Apply y_scale and offsets in place to a copy of some points."""
+        if self.y_scale != 1.0:
+            pts[:, 1] *= self.y_scale
+        if self.offset_x != 0.0 or self.offset_y != 0.0:
+            pts += np.array([self.offset_x, self.offset_y], dtype=np.float32)
+        return pts
+
+    def clear_caches(self) -> None:
+        """Drop derived data; needed after points or color_data change in place."""
+        self._range_cache = None
+        self._norm_cache = None
+        self._settle_cache = None
+
     def color_range(self) -> tuple[float, float]:
         """Full-array (min, max) of color_data, cached."""
         key = id(self.color_data)
@@ -95,7 +132,8 @@ class Overlay:
 
         span = vmax - vmin
         if span > 1e-9:
-            norm = (self.color_data.astype(np.float32) - vmin) / span
+            norm = np.subtract(self.color_data, vmin, dtype=np.float32)
+            norm /= span
         else:
             norm = np.full(len(self.color_data), 0.5, dtype=np.float32)
 
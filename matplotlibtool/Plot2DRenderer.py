@@ -42,6 +42,69 @@ def auto_point_size(ax, drawn_count: int) -> float:
     return float(np.clip(diameter_pt * diameter_pt, AUTO_SIZE_MIN, AUTO_SIZE_MAX))
 
 
+def _cull_box(
+    view_xlim: tuple[float, float],
+    view_ylim: tuple[float, float],
+    cull_margin: float,
+) -> tuple[float, float, float, float]:
+    x_pad = (view_xlim[1] - view_xlim[0]) * cull_margin
+    y_pad = (view_ylim[1] - view_ylim[0]) * cull_margin
+    return (
+        view_xlim[0] - x_pad,
+        view_xlim[1] + x_pad,
+        view_ylim[0] - y_pad,
+        view_ylim[1] + y_pad,
+    )
+
+
+def _cull(
+    plot: Overlay,
+    cull_box: tuple[float, float, float, float],
+    max_display_points: int,
+) -> tuple[np.ndarray, int, np.ndarray]:
+    """
+    Points to index into, how many fall within the x extent, and the indices
+    kept in the box after subsampling.
+    """
+    # cull the stored points against the view mapped back through the
+    # plot's scale and offsets, so only the kept subset is scaled;
+    # settle mode's log transform has no such inverse
+    if plot.settle_ref is None:
+        points = plot.points
+        wx0, wx1, wy0, wy1 = plot.raw_window(*cull_box)
+    else:
+        points = plot.display_points()
+        wx0, wx1, wy0, wy1 = cull_box
+
+    x = points[:, 0]
+    y = points[:, 1]
+    mask_x = (x >= wx0) & (x <= wx1)
+    idx = np.flatnonzero(mask_x & (y >= wy0) & (y <= wy1))
+
+    if idx.size > max_display_points:
+        step = -(-idx.size // max_display_points)  # ceil div
+        idx = idx[::step]
+    return points, int(mask_x.sum()), idx
+
+
+def _display(
+    plot: Overlay,
+    color_range: tuple[float, float] | None,
+    points: np.ndarray,
+    idx: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Display-space points and normalized colors for the kept indices."""
+    display_points = points[idx]
+    if plot.settle_ref is None:
+        display_points = plot.to_display(display_points)
+
+    if plot.color_data is not None and color_range is not None:
+        display_colors = plot.normalized_colors(*color_range)[idx]
+    else:
+        display_colors = None
+    return display_points, display_colors
+
+
 class Matplotlib2DRenderer:
     def __init__(self):
         self.plot_initialized = False
@@ -71,10 +134,7 @@ class Matplotlib2DRenderer:
             self._initialize_axes(ax)
             self.plot_initialized = True
 
-        x_pad = (view_xlim[1] - view_xlim[0]) * cull_margin
-        y_pad = (view_ylim[1] - view_ylim[0]) * cull_margin
-        cx0, cx1 = view_xlim[0] - x_pad, view_xlim[1] + x_pad
-        cy0, cy1 = view_ylim[0] - y_pad, view_ylim[1] + y_pad
+        cull_box = _cull_box(view_xlim, view_ylim, cull_margin)
 
         rasterized = not disable_antialiasing
 
@@ -100,14 +160,8 @@ class Matplotlib2DRenderer:
                 prepared.append(None)
                 continue
 
-            points = plot.display_points()
-
-            x = points[:, 0]
-            y = points[:, 1]
-            mask_x = (x >= cx0) & (x <= cx1)
-            max_x_count = max(max_x_count, int(mask_x.sum()))
-            mask = mask_x & (y >= cy0) & (y <= cy1)
-            idx = np.flatnonzero(mask)
+            points, x_count, idx = _cull(plot, cull_box, max_display_points)
+            max_x_count = max(max_x_count, x_count)
 
             if idx.size == 0:
                 if plot.scatter_artist is not None:
@@ -115,10 +169,6 @@ class Matplotlib2DRenderer:
                 prepared.append(None)
                 continue
 
-            if idx.size > max_display_points:
-                step = -(-idx.size // max_display_points)  # ceil div
-                idx = idx[::step]
-
             prepared.append((plot, color_range, points, idx))
 
         shared_size = auto_point_size(ax, max_x_count)
@@ -131,12 +181,7 @@ class Matplotlib2DRenderer:
                 continue
             plot, color_range, points, idx = entry
 
-            display_points = points[idx]
-
-            if plot.color_data is not None and color_range is not None:
-                display_colors = plot.normalized_colors(*color_range)[idx]
-            else:
-                display_colors = None
+            display_points, display_colors = _display(plot, color_range, points, idx)
 
             self._update_scatter(ax, plot, display_points, display_colors, rasterized)
 
@@ -180,6 +225,40 @@ class Matplotlib2DRenderer:
         ax.set_xlim(*view_xlim)
         ax.set_ylim(*view_ylim)
 
+    def render_scatter(
+        self,
+        ax: Axes,
+        plot: Overlay,
+        *,
+        view_xlim: tuple[float, float],
+        view_ylim: tuple[float, float],
+        color_range: tuple[float, float] | None,
+        cull_margin: float,
+        max_display_points: int,
+        disable_antialiasing: bool,
+    ) -> None:
+        """
+        Re-cull and redraw one plot's scatter artist, leaving every other
+        artist as it is.
+
+        Only valid for a visible plot that draws no lines and has rendered
+        before, after a change that moves its points vertically: the shared
+        auto marker size depends on x extents alone, so it stays correct.
+        """
+        points, _, idx = _cull(
+            plot,
+            _cull_box(view_xlim, view_ylim, cull_margin),
+            max_display_points,
+        )
+        if idx.size == 0:
+            if plot.scatter_artist is not None:
+                plot.scatter_artist.set_visible(False)
+            return
+        display_points, display_colors = _display(plot, color_range, points, idx)
+        self._update_scatter(
+            ax, plot, display_points, display_colors, not disable_antialiasing
+        )
+
     def _update_scatter(
         self,
         ax: Axes,
@@ -15,6 +15,8 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+from .CoordinateTransformEngine import TransformParams
+
 if TYPE_CHECKING:
     from .Plot2D import Plot2D
 
@@ -144,10 +146,10 @@ class PlotDataProcessor:
                 f"Y field '{y_field}' not found in data. Available: {field_names}"
             )
 
-        # Extract X and Y data
-        x_data = data[x_field].astype(np.float32)
-        y_data = data[y_field].astype(np.float32)
-        points_xy = np.column_stack((x_data, y_data))
+        # Extract X and Y data, cast straight into the (N, 2) points array
+        points_xy = np.empty((len(data), 2), dtype=np.float32)
+        np.copyto(points_xy[:, 0], data[x_field], casting="unsafe")
+        np.copyto(points_xy[:, 1], data[y_field], casting="unsafe")
 
         # Extract color data if specified
         extracted_color_data = None
@@ -157,13 +159,15 @@ class PlotDataProcessor:
                     f"Color field '{color_field}' not found in data. "
                     f"Available: {field_names}"
                 )
-            extracted_color_data = data[color_field].astype(np.float32)
+            extracted_color_data = np.asarray(data[color_field], dtype=np.float32)
 
-        # Apply coordinate transformation
-        if transform_params is not None:
+        # Apply coordinate transformation. points_xy is already float32 and
+        # owned by this call, so the identity transform uses it as is
+        if transform_params is not None and transform_params["type"] == "raw":
+            transformed_points = points_xy
+            result_transform_params = transform_params.copy()
+        elif transform_params is not None:
             # Use provided transform parameters
-            from .CoordinateTransformEngine import TransformParams
-
             transform_params_obj = TransformParams.from_dict(transform_params)
             transformed_points = self.viewer.transform_engine.apply_transform(
                 points_xy, transform_params_obj
@@ -183,10 +187,8 @@ class PlotDataProcessor:
             result_transform_params = params.to_dict()
         else:
             # Raw points (identity transform)
-            transformed_points, params = self.viewer.transform_engine.raw_points(
-                points_xy
-            )
-            result_transform_params = params.to_dict()
+            transformed_points = points_xy
+            result_transform_params = TransformParams("raw").to_dict()
 
         # Return processed data
         return ProcessedPlotData(
@@ -642,9 +642,14 @@ class PlotEventHandlers:
         spec = res.spectrum
 
         plot = self.viewer.plot_manager.plots[self._fft_plot_index]
-        plot.points = np.column_stack((spec.frequencies, spec.db)).astype(
-            np.float32
-        )
+        points = plot.points
+        if points.shape != (len(spec.frequencies), 2) or not points.flags.writeable:
+            points = np.empty((len(spec.frequencies), 2), dtype=np.float32)
+        # same bins, new units: rewrite the plot's buffer rather than rebind it
+        np.copyto(points[:, 0], spec.frequencies, casting="unsafe")
+        np.copyto(points[:, 1], spec.db, casting="unsafe")
+        plot.points = points
+        plot.clear_caches()
         array_index = self.viewer.array_field_integration.array_index_for_plot(
             self._fft_plot_index
         )
@@ -653,6 +658,7 @@ class PlotEventHandlers:
         )["data"]
         data["frequency"] = spec.frequencies
         data["asd"] = spec.asd
+        self.viewer.array_field_integration.invalidate_array_caches(array_index)
 
         color = "white" if self.viewer.dark_mode else "black"
         self.viewer.ax.set_xlabel(f"frequency [{unit}]", color=color)
@@ -735,9 +741,9 @@ class PlotEventHandlers:
         ):
             if not plots[plot_index].visible:
                 continue
-            data = manager.get_array_info(array_index)["data"]
-            if data.dtype.names is None or "pixel" not in data.dtype.names:
+            if not manager.has_field(array_index, "pixel"):
                 continue
+            data = manager.get_array_info(array_index)["data"]
             candidates.append((plot_index, field, data))
         return candidates
 
@@ -1008,11 +1014,15 @@ class PlotEventHandlers:
         with self.viewer.busy_manager.busy_operation("Resetting view"):
             self.viewer.fit_view()
 
-    def apply_view_bounds(self):
-        """Apply custom view bounds from the text fields."""
+    def apply_view_bounds(
+        self,
+        xmin: float,
+        xmax: float,
+        ymin: float,
+        ymax: float,
+    ):
+        """Apply custom view bounds entered in the control bar (nan = keep current)."""
         with self.viewer.busy_manager.busy_operation("Applying view bounds"):
-            xmin, xmax, ymin, ymax = self.viewer.control_bar_manager.get_view_bounds()
-
             is_valid, error_msg, bounds = self.viewer.view_manager.validate_bounds(
                 xmin=xmin,
                 xmax=xmax,
@@ -1093,11 +1103,12 @@ class PlotEventHandlers:
                     if not array_info:
                         continue
 
-                    data = array_info["data"]
-                    if field_name not in data.dtype.names:
+                    if field_name not in array_info["field_set"]:
                         continue
 
-                    field_data = data[field_name].astype(np.float32)
+                    field_data = self.viewer.array_field_integration.array_field_manager.get_field_array(
+                        array_index, field_name
+                    )
                     if len(field_data) > 0:
                         local_min = float(field_data.min())
                         local_max = float(field_data.max())
@@ -1126,15 +1137,17 @@ class PlotEventHandlers:
                     print(f"[WARNING] Could not get array info for array {array_index}")
                     continue
 
-                data = array_info["data"]
-                if field_name not in data.dtype.names:
+                if field_name not in array_info["field_set"]:
                     print(
                         f"[ERROR] Field '{field_name}' not found in array {array_index}"
                     )
                     continue
 
                 plot = self.viewer.plot_manager.plots[plot_index]
-                plot.color_data = data[field_name].astype(np.float32)
+                # every field plot of the array shares the one cached column
+                plot.color_data = self.viewer.array_field_integration.array_field_manager.get_field_array(
+                    array_index, field_name
+                )
                 array_info["properties"]["color_field"] = field_name
 
                 if global_color_min is not None and global_color_max is not None:
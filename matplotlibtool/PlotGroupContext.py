@@ -218,7 +218,7 @@ class PlotGroupContext:
                 raise ValueError(error_msg)
 
         # Extract color data and update global range
-        color_data = data[color_field].astype(np.float32)
+        color_data = np.asarray(data[color_field], dtype=np.float32)
 
         if len(color_data) > 0:
             local_min = float(color_data.min())
@@ -270,6 +270,10 @@ class PlotGroupContext:
             global_color_min=self.global_color_min,
             global_color_max=self.global_color_max,
         )
+        if processed.color_data is not None:
+            self.viewer.array_field_integration.array_field_manager.cache_field_array(
+                array_index, color_field, processed.color_data
+            )
 
         # Generate plot name
         plot_name = processed.plot_name or y_field
@@ -334,8 +338,10 @@ class PlotGroupContext:
         global_color_min = None
         global_color_max = None
 
-        if color_field is not None and color_field in data.dtype.names:
-            color_data = data[color_field].astype(np.float32)
+        manager = viewer.array_field_integration.array_field_manager
+        if color_field is not None and manager.has_field(array_index, color_field):
+            # the column the array's field plots are colored by
+            color_data = manager.get_field_array(array_index, color_field)
             if len(color_data) > 0:
                 global_color_min = float(color_data.min())
                 global_color_max = float(color_data.max())
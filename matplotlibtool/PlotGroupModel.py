@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# tab-width:4
+
+"""
+Plot/group selector model.
+
+Backs the control bar's plot/group combo. Rows are kept as parallel lists
+(type, id, nested) and labels are produced on demand from the PlotManager,
+so only the rows the popup actually shows are ever formatted.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from PyQt6.QtCore import QAbstractListModel
+from PyQt6.QtCore import QModelIndex
+from PyQt6.QtCore import Qt
+
+if TYPE_CHECKING:
+    from .PlotManager import PlotGroupInfo
+    from .PlotManager import PlotManager
+
+
+class PlotGroupModel(QAbstractListModel):
+    """List model of group headers, their member plots and ungrouped plots."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._plot_manager: PlotManager | None = None
+        self._types: list[str] = []
+        self._ids: list[int] = []
+        self._nested: list[bool] = []
+        self._row_of: dict[tuple[str, int], int] = {}
+        self._last_group_row = -1
+        # Plain labels without item data, see reset_labels()
+        self._labels: list[str] | None = None
+
+    def reset(
+        self,
+        plot_manager: PlotManager,
+        groups: list[PlotGroupInfo],
+        ungrouped_plots: list[int],
+    ) -> None:
+        """Replace all rows: each group header followed by its plots, then ungrouped plots."""
+        types: list[str] = []
+        ids: list[int] = []
+        nested: list[bool] = []
+        plot_count = len(plot_manager.plots)
+        last_group_row = -1
+
+        for group_info in groups:
+            last_group_row = len(types)
+            types.append("group")
+            ids.append(group_info.group_id)
+            nested.append(False)
+            for plot_index in group_info.plot_indices:
+                if plot_index < plot_count:
+                    types.append("plot")
+                    ids.append(plot_index)
+                    nested.append(True)
+
+        for plot_index in ungrouped_plots:
+            types.append("plot")
+            ids.append(plot_index)
+            nested.append(False)
+
+        self.beginResetModel()
+        self._plot_manager = plot_manager
+        self._types = types
+        self._ids = ids
+        self._nested = nested
+        # Later duplicates win, matching the old linear scan
+        self._row_of = {key: row for row, key in enumerate(zip(types, ids))}
+        self._last_group_row = last_group_row
+        self._labels = None
+        self.endResetModel()
+
+    def reset_labels(self, labels: list[str]) -> None:
+        """Replace all rows with fixed labels that carry no item data."""
+        self.beginResetModel()
+        self._plot_manager = None
+        self._types = []
+        self._ids = []
+        self._nested = []
+        self._row_of = {}
+        self._last_group_row = -1
+        self._labels = list(labels)
+        self.endResetModel()
+
+    def row_of(self, item_type: str | None, item_id: int | None) -> int:
+        """Row holding (item_type, item_id), or -1."""
+        return self._row_of.get((item_type, item_id), -1)
+
+    @property
+    def last_group_row(self) -> int:
+        """Row of the last group header, or -1 when there are no groups."""
+        return self._last_group_row
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._labels is not None:
+            return len(self._labels)
+        return len(self._types)
+
+    def data(
+        self,
+        index: QModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if self._labels is not None:
+                return self._labels[row]
+            return self._label(row)
+        if role == Qt.ItemDataRole.UserRole:
+            if self._labels is not None:
+                return None
+            return (self._types[row], self._ids[row])
+        return None
+
+    def _label(self, row: int) -> str:
+        plot_manager = self._plot_manager
+        item_id = self._ids[row]
+
+        if self._types[row] == "group":
+            group_info = plot_manager.get_group_info(item_id)
+            if group_info is None:
+                return ""
+            return f"📦 {group_info.group_name} ({len(group_info.plot_indices)} plots)"
+
+        plot = plot_manager.plots[item_id]
+        name = plot_manager.plot_names.get(item_id) or f"Plot {item_id + 1}"
+        prefix = "  └─ " if self._nested[row] else ""
+        return f"{prefix}{name} ({len(plot.points):,} pts)"
@@ -19,6 +19,10 @@ from PyQt6.QtCore import pyqtSignal
 from .CoordinateTransformEngine import CoordinateTransformEngine
 from .Plot2DOverlay import Overlay
 
+# Value of a selection property whose group members differ. Consumers test
+# it with `is`: this one object is the only "mixed" ever returned.
+MIXED = "mixed"
+
 # UI property name -> (Overlay attribute, coercion)
 _PROPERTY_MAP: dict[str, tuple[str, Any]] = {
     "size": ("size", float),
@@ -229,6 +233,9 @@ class PlotManager:
         plot = self.plots[plot_index]
         plot.points = points
         plot.color_data = color_data
+        # the new data may reuse the old buffers, so identity-keyed caches
+        # cannot tell it changed
+        plot.clear_caches()
         if color_range is not None:
             self.plot_global_color_ranges[plot_index] = color_range
         self._invalidate_label_cache()
@@ -286,15 +293,28 @@ class PlotManager:
                 labels.append(f"{base} ({len(plot.points):,} pts)")
         return labels
 
-    def set_plot_visibility(self, plot_index: int, visible: bool) -> bool:
+    def set_plot_visibility(
+        self,
+        plot_index: int,
+        visible: bool,
+        notify: bool = True,
+    ) -> bool:
+        """notify=False is for callers that update the artist themselves."""
         if 0 <= plot_index < len(self.plots):
             plot = self.plots[plot_index]
             if plot.visible != visible:
                 plot.visible = visible
-                self.signals.plotVisibilityChanged.emit(plot_index, visible)
+                if notify:
+                    self.signals.plotVisibilityChanged.emit(plot_index, visible)
                 return True
         return False
 
+    def get_artist(self, plot_index: int):
+        """The plot's scatter artist, or None before its first render."""
+        if 0 <= plot_index < len(self.plots):
+            return self.plots[plot_index].scatter_artist
+        return None
+
     def _apply_property(self, plot: Overlay, property_name: str, value: Any) -> bool:
         attr, coerce = _PROPERTY_MAP[property_name]
         if getattr(plot, attr) != value:
@@ -367,7 +387,8 @@ class PlotManager:
         props = props_of(self.plots[plot_indices[0]])
         for plot_index in plot_indices[1:]:
             for key, value in props_of(self.plots[plot_index]).items():
-                if props[key] != value:
-                    props[key] = "mixed"
+                current = props[key]
+                if current is not MIXED and current != value:
+                    props[key] = MIXED
 
         return props
@@ -3,6 +3,7 @@
 # pylint: disable=no-name-in-module
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
 import numpy as np
@@ -117,21 +118,18 @@ class ViewManager:
 
     def validate_bounds(
         self,
-        xmin: str | None = None,
-        xmax: str | None = None,
-        ymin: str | None = None,
-        ymax: str | None = None,
+        xmin: float = math.nan,
+        xmax: float = math.nan,
+        ymin: float = math.nan,
+        ymax: float = math.nan,
     ) -> tuple[bool, str, ViewBounds]:
-        """Parse user-typed bounds, falling back to current values for blanks."""
+        """Check user-entered bounds, falling back to current values for nan."""
         current = self.get_current_bounds()
 
-        try:
-            parsed_xmin = float(xmin) if xmin and xmin.strip() else current.xlim[0]
-            parsed_xmax = float(xmax) if xmax and xmax.strip() else current.xlim[1]
-            parsed_ymin = float(ymin) if ymin and ymin.strip() else current.ylim[0]
-            parsed_ymax = float(ymax) if ymax and ymax.strip() else current.ylim[1]
-        except ValueError as e:
-            return False, f"Invalid number format: {e}", current
+        parsed_xmin = current.xlim[0] if math.isnan(xmin) else xmin
+        parsed_xmax = current.xlim[1] if math.isnan(xmax) else xmax
+        parsed_ymin = current.ylim[0] if math.isnan(ymin) else ymin
+        parsed_ymax = current.ylim[1] if math.isnan(ymax) else ymax
 
         if parsed_xmin >= parsed_xmax:
             return False, "xmin must be less than xmax", current